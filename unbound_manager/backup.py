@@ -117,12 +117,14 @@ class BackupManager:
             for item in temp_dir.iterdir():
                 target = UNBOUND_DIR / item.name
                 
-                # Remove existing file/directory
-                if target.exists():
-                    if target.is_dir():
-                        shutil.rmtree(target)
-                    else:
-                        target.unlink()
+                # Remove existing file/directory; try unlink first rather than
+                # stat-ing every target (unlink(missing_ok=) needs Python 3.8)
+                try:
+                    target.unlink()
+                except IsADirectoryError:
+                    shutil.rmtree(target)
+                except FileNotFoundError:
+                    pass
                 
                 # Move restored file/directory
                 shutil.move(str(item), str(target))
@@ -6,47 +6,162 @@ from __future__ import annotations
 import sys
 import os
 import time
+import datetime
 import shutil
 import tempfile
-from typing import Optional, List, Tuple, Callable
+import importlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from urllib.request import urlopen
+from typing import Optional, List, Tuple, Callable, Dict
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, IntPrompt
 from rich.layout import Layout
 from rich.text import Text
+from rich.markup import escape
 from rich.align import Align
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
-from .constants import APP_VERSION, UNBOUND_SERVICE, REDIS_SERVICE
-from .utils import check_root, check_service_status, run_command, prompt_yes_no, parse_unbound_stats
-from .installer import UnboundInstaller
-from .config_manager import ConfigManager
-from .redis_manager import RedisManager
-from .dnssec import DNSSECManager
-from .troubleshooter import Troubleshooter
-from .tester import UnboundTester
-from .backup import BackupManager
+from .constants import APP_VERSION, MANAGER_VERSION_URL, SOURCE_DIR, UNBOUND_SERVICE, REDIS_SERVICE
+from .utils import (
+    check_root, check_service_status, restart_service, run_command, stream_command, prompt_yes_no,
+    get_unbound_stats,
+)
 from .menu_system import InteractiveMenu, MenuItem, MenuCategory, SubMenu, create_submenu
-from .ui import print_header, pause, print_success, print_error, print_info, print_warning
+from .ui import print_header, pause, print_success, print_error, print_info, print_warning, console
 
-console = Console()
+# Status markup parsed once and reused on every redraw
+_STATUS_ACTIVE = Text.from_markup("[green]● Active[/green]")
+_STATUS_INACTIVE = Text.from_markup("[red]○ Inactive[/red]")
+_DOT_ON = Text.from_markup("[green]●[/green]")
+_DOT_OFF = Text.from_markup("[red]○[/red]")
+_STATUS_CELL = {True: _STATUS_ACTIVE, False: _STATUS_INACTIVE}
+_STATUS_DOT = {True: _DOT_ON, False: _DOT_OFF}
+_STATUS_LABEL = {True: "● Running", False: "○ Stopped"}
+
+# Services shown on the status screen: (display name, unit)
+_SERVICES = (("Unbound DNS", UNBOUND_SERVICE), ("Redis Cache", REDIS_SERVICE))
+
+# Static top of the banner; only the status line changes between redraws
+_BANNER_TOP = Text.from_markup(
+    "┌" + "─" * 58 + "┐\n"
+    f"│  [bold cyan]UNBOUND DNS MANAGER[/bold cyan]  v{APP_VERSION:<30} │\n"
+    "├" + "─" * 58 + "┤\n"
+)
+
+# Help screen content, assembled into a single Text at import time
+_HELP_SECTIONS = (
+    ("[bold]Navigation:[/bold]", (
+        "↑/↓ or j/k    Navigate menu",
+        "Enter         Select item",
+        "ESC or b      Go back",
+        "r             Return (in submenus)",
+        "q             Quit program",
+    )),
+    ("[bold]Quick Keys:[/bold]", (
+        "s             Services (start/stop)",
+        "v             View (status/logs)",
+        "h             Help",
+        "1-9           Quick select",
+    )),
+    ("[bold]Menu Categories:[/bold]", (
+        "Services       Start/Stop/Restart DNS",
+        "View           Status, Stats, Logs",
+        "Configuration  DNS, Server, Access, Cache",
+        "Testing        Diagnostics & benchmarks",
+        "Backups        Create/Restore backups",
+        "Install/Update Unbound & Manager updates",
+    )),
+)
+_HELP_TEXT = Text.from_markup(
+    "".join(
+        title + "\n" + "".join(f"  {item}\n" for item in items) + "\n"
+        for title, items in _HELP_SECTIONS
+    )
+    + "─" * 60 + "\n"
+    + "\n[bold]Documentation:[/bold]\n"
+    + "  https://github.com/regix1/unbound-manager"
+)
+
+# Only counters the status screen needs from unbound-control stats
+_QUICK_STATS_KEYS = ("total.num.queries", "total.num.cachehits")
+
+# Advanced service control entries: (menu label, systemctl verb, unit, display name)
+_SERVICE_ACTIONS = (
+    ("Start Unbound", "start", UNBOUND_SERVICE, "Unbound"),
+    ("Stop Unbound", "stop", UNBOUND_SERVICE, "Unbound"),
+    ("Restart Unbound", "restart", UNBOUND_SERVICE, "Unbound"),
+    ("Start Redis", "start", REDIS_SERVICE, "Redis"),
+    ("Stop Redis", "stop", REDIS_SERVICE, "Redis"),
+    ("Restart Redis", "restart", REDIS_SERVICE, "Redis"),
+)
+_ACTION_PROGRESS = {"start": "Starting", "stop": "Stopping", "restart": "Restarting"}
+_ACTION_DONE = {"start": "started", "stop": "stopped", "restart": "restarted"}
+
+# Seconds a fetched remote version is reused by update_manager
+_REMOTE_VERSION_TTL = 300.0
+
+# Command line that re-launches this program after an update; a
+# "python -m unbound_manager" start is re-run as a module, not as a file
+if sys.argv and sys.argv[0].endswith("__main__.py"):
+    _RESTART_ARGV = (sys.executable, "-m", __package__, *sys.argv[1:])
+else:
+    _RESTART_ARGV = (sys.executable, *sys.argv)
+
+
+class _LazyManager:
+    """Import and create a manager the first time it is accessed.
+    
+    The instance is stored on the owning object, so later lookups are plain
+    attribute reads and the import only happens for menus the user opens.
+    """
+    
+    def __init__(self, module: str, class_name: str):
+        self.module = module
+        self.class_name = class_name
+        self.name = ""
+    
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        module = importlib.import_module(self.module, __package__)
+        manager = getattr(module, self.class_name)()
+        obj.__dict__[self.name] = manager
+        return manager
 
 
 class UnboundManagerCLI:
     """Main CLI class for Unbound Manager with interactive menu."""
     
+    installer = _LazyManager(".installer", "UnboundInstaller")
+    config_manager = _LazyManager(".config_manager", "ConfigManager")
+    redis_manager = _LazyManager(".redis_manager", "RedisManager")
+    dnssec_manager = _LazyManager(".dnssec", "DNSSECManager")
+    troubleshooter = _LazyManager(".troubleshooter", "Troubleshooter")
+    tester = _LazyManager(".tester", "UnboundTester")
+    backup_manager = _LazyManager(".backup", "BackupManager")
+    
     def __init__(self):
         """Initialize the CLI."""
-        self.installer = UnboundInstaller()
-        self.config_manager = ConfigManager()
-        self.redis_manager = RedisManager()
-        self.dnssec_manager = DNSSECManager()
-        self.troubleshooter = Troubleshooter()
-        self.tester = UnboundTester()
-        self.backup_manager = BackupManager()
         self.menu = InteractiveMenu()
+        # service name -> (time checked, is running)
+        self._status_cache: Dict[str, Tuple[float, bool]] = {}
+        self._probe_pool = ThreadPoolExecutor(max_workers=4)
+        # (unbound running, redis running, width) -> rendered banner
+        self._banner_cache: Dict[Tuple[bool, bool, int], str] = {}
+        # In-flight remote version check, started when Install/Update opens
+        self._remote_version_future: Optional[Future] = None
+        # (time fetched, version) of the last successful remote check
+        self._remote_version_cache: Optional[Tuple[float, str]] = None
+        self._service_options = [
+            (label, partial(self._service_action, verb, service, name))
+            for label, verb, service, name in _SERVICE_ACTIONS
+        ]
         self.setup_menu()
     
     def wrap_action(self, func: Callable) -> Callable:
@@ -67,25 +182,57 @@ class UnboundManagerCLI:
                 pause()
         return wrapped
     
-    def show_banner(self) -> None:
-        """Display the application banner with status."""
-        console.clear()
-        
+    def _probe_all(self, services: Tuple[str, ...], ttl: float = 2.0) -> List[bool]:
+        """Get the status of several services, probing stale ones concurrently.
+        
+        Args:
+            services: Service names to check
+            ttl: Reuse cached results younger than this many seconds
+        
+        Returns:
+            Running state for each service, in the order given
+        """
+        now = time.monotonic()
+        stale = [
+            service for service in services
+            if service not in self._status_cache or now - self._status_cache[service][0] >= ttl
+        ]
+        for service, status in zip(stale, self._probe_pool.map(check_service_status, stale)):
+            self._status_cache[service] = (now, status)
+        return [self._status_cache[service][1] for service in services]
+    
+    def _record_status(self, service: str, running: bool) -> None:
+        """Store a status that is already known, e.g. from restart_service."""
+        self._status_cache[service] = (time.monotonic(), running)
+    
+    def _invalidate_status(self, *services: str) -> None:
+        """Drop cached status after a service has been started or stopped."""
+        for service in services:
+            self._status_cache.pop(service, None)
+    
+    def render_banner(self) -> str:
+        """Render the application banner with status to an ANSI string."""
         # Get service status
-        unbound_status = check_service_status(UNBOUND_SERVICE)
-        redis_status = check_service_status(REDIS_SERVICE)
-        
-        # Build status indicators
-        unbound_indicator = "[green]●[/green]" if unbound_status else "[red]○[/red]"
-        redis_indicator = "[green]●[/green]" if redis_status else "[red]○[/red]"
-        
-        # Display header
-        console.print("┌" + "─" * 58 + "┐")
-        console.print(f"│  [bold cyan]UNBOUND DNS MANAGER[/bold cyan]  v{APP_VERSION:<30} │")
-        console.print("├" + "─" * 58 + "┤")
-        console.print(f"│  Status: Unbound {unbound_indicator}  Redis {redis_indicator}                             │")
-        console.print("└" + "─" * 58 + "┘")
-        console.print()
+        unbound_status, redis_status = self._probe_all((UNBOUND_SERVICE, REDIS_SERVICE))
+        
+        # The banner only has four possible states, so render each once per width
+        key = (unbound_status, redis_status, console.width)
+        rendered = self._banner_cache.get(key)
+        if rendered is None:
+            banner = _BANNER_TOP.copy()
+            banner.append_text(Text.assemble(
+                "│  Status: Unbound ",
+                _STATUS_DOT[unbound_status],
+                "  Redis ",
+                _STATUS_DOT[redis_status],
+                "                             │",
+            ))
+            banner.append("\n└" + "─" * 58 + "┘\n")
+            with console.capture() as capture:
+                console.print(banner, highlight=False)
+            rendered = self._banner_cache[key] = capture.get()
+        
+        return rendered
     
     def setup_menu(self) -> None:
         """Setup the interactive menu structure."""
@@ -97,7 +244,8 @@ class UnboundManagerCLI:
             self.manage_services_quick,
             prefix="[S]",
             description="Start/Stop/Restart DNS services",
-            key="s"
+            key="s",
+            clear_screen=False
         ))
         
         # View - Status, Stats, Logs combined
@@ -106,7 +254,8 @@ class UnboundManagerCLI:
             self.view_menu,
             prefix="[V]",
             description="Status, statistics, and logs",
-            key="v"
+            key="v",
+            clear_screen=False
         ))
         
         # ===== CONFIGURATION =====
@@ -114,27 +263,31 @@ class UnboundManagerCLI:
         config_category.add_item(MenuItem(
             "DNS Upstream",
             self.change_dns_upstream,
-            description="Change DNS provider"
+            description="Change DNS provider",
+            clear_screen=False
         ))
         config_category.add_item(MenuItem(
             "Server Settings",
-            self.wrap_action(self.config_manager.manage_configuration),
-            description="Edit server config"
+            self.wrap_action(lambda: self.config_manager.manage_configuration()),
+            description="Edit server config",
+            clear_screen=False
         ))
         config_category.add_item(MenuItem(
             "Access Control",
-            self.wrap_action(self.config_manager.edit_access_control),
-            description="Allowed networks"
+            self.wrap_action(lambda: self.config_manager.edit_access_control()),
+            description="Allowed networks",
+            clear_screen=False
         ))
         config_category.add_item(MenuItem(
             "Redis Cache",
-            self.wrap_action(self.redis_manager.configure_redis),
+            self.wrap_action(lambda: self.redis_manager.configure_redis()),
             description="Cache settings"
         ))
         config_category.add_item(MenuItem(
             "DNSSEC",
-            self.wrap_action(self.dnssec_manager.manage_dnssec),
-            description="Security settings"
+            self.wrap_action(lambda: self.dnssec_manager.manage_dnssec()),
+            description="Security settings",
+            clear_screen=False
         ))
         self.menu.add_category(config_category)
         
@@ -142,12 +295,12 @@ class UnboundManagerCLI:
         test_category = MenuCategory("Testing", prefix="[T]")
         test_category.add_item(MenuItem(
             "Run Diagnostics",
-            self.wrap_action(self.troubleshooter.run_diagnostics),
+            self.wrap_action(lambda: self.troubleshooter.run_diagnostics()),
             description="Check for issues"
         ))
         test_category.add_item(MenuItem(
             "Test DNS",
-            self.wrap_action(self.tester.run_all_tests),
+            self.wrap_action(lambda: self.tester.run_all_tests()),
             description="DNS resolution tests"
         ))
         test_category.add_item(MenuItem(
@@ -157,7 +310,7 @@ class UnboundManagerCLI:
         ))
         test_category.add_item(MenuItem(
             "Network",
-            self.wrap_action(self.troubleshooter.check_connectivity),
+            self.wrap_action(lambda: self.troubleshooter.check_connectivity()),
             description="Connectivity check"
         ))
         self.menu.add_category(test_category)
@@ -167,25 +320,30 @@ class UnboundManagerCLI:
         backup_category.add_item(MenuItem(
             "Create Backup",
             self.backup_configuration_interactive,
-            description="Backup current config"
+            description="Backup current config",
+            clear_screen=False
         ))
         backup_category.add_item(MenuItem(
             "Restore Backup",
-            self.wrap_action(self.backup_manager.restore_backup),
-            description="Restore from backup"
+            self.wrap_action(lambda: self.backup_manager.restore_backup()),
+            description="Restore from backup",
+            clear_screen=False
         ))
         backup_category.add_item(MenuItem(
             "Cleanup",
             self.cleanup_backups,
-            description="Remove old backups"
+            description="Remove old backups",
+            clear_screen=False
         ))
         self.menu.add_category(backup_category)
         
         # ===== INSTALLATION & UPDATES =====
-        install_category = MenuCategory("Install/Update", prefix="[I]")
+        install_category = MenuCategory(
+            "Install/Update", prefix="[I]", on_expand=self._prefetch_remote_version
+        )
         install_category.add_item(MenuItem(
             "Update Unbound DNS",
-            self.wrap_action(self.installer.update_unbound),
+            self.wrap_action(lambda: self.installer.update_unbound()),
             description="Upgrade DNS server version",
             style="cyan"
         ))
@@ -193,28 +351,30 @@ class UnboundManagerCLI:
             "Update This Tool",
             self.update_manager,
             description="Pull latest manager code",
-            style="yellow"
+            style="yellow",
+            clear_screen=False
         ))
         install_category.add_item(MenuItem(
             "Fresh Install",
-            self.wrap_action(self.installer.install_unbound),
+            self.wrap_action(lambda: self.installer.install_unbound()),
             description="New installation"
         ))
         install_category.add_item(MenuItem(
             "Fix Installation",
-            self.wrap_action(self.installer.fix_existing_installation),
+            self.wrap_action(lambda: self.installer.fix_existing_installation()),
             description="Repair issues"
         ))
         install_category.add_item(MenuItem(
             "Regenerate Keys",
-            self.wrap_action(self.dnssec_manager.generate_control_keys),
+            self.wrap_action(lambda: self.dnssec_manager.generate_control_keys()),
             description="New control keys"
         ))
         install_category.add_item(MenuItem(
             "Uninstall",
             self.uninstall_manager,
             description="Remove manager",
-            style="red"
+            style="red",
+            clear_screen=False
         ))
         self.menu.add_category(install_category)
         
@@ -224,7 +384,8 @@ class UnboundManagerCLI:
             self.show_help,
             prefix="[H]",
             description="Help & documentation",
-            key="h"
+            key="h",
+            clear_screen=False
         ))
         
         self.menu.add_item(MenuItem(
@@ -233,7 +394,8 @@ class UnboundManagerCLI:
             prefix="[Q]",
             description="Exit program",
             key="q",
-            style="red"
+            style="red",
+            clear_screen=False
         ))
     
     def show_detailed_status(self) -> None:
@@ -246,37 +408,25 @@ class UnboundManagerCLI:
         table.add_column("Status", justify="center", width=12)
         table.add_column("Details", width=26)
         
-        # Unbound status
-        unbound_status = check_service_status(UNBOUND_SERVICE)
-        if unbound_status:
-            unbound_display = "[green]● Active[/green]"
-            unbound_details = self._get_service_uptime(UNBOUND_SERVICE)
-        else:
-            unbound_display = "[red]○ Inactive[/red]"
-            unbound_details = "Service not running"
-        table.add_row("Unbound DNS", unbound_display, unbound_details)
-        
-        # Redis status
-        redis_status = check_service_status(REDIS_SERVICE)
-        if redis_status:
-            redis_display = "[green]● Active[/green]"
-            redis_details = self._get_service_uptime(REDIS_SERVICE)
-        else:
-            redis_display = "[red]○ Inactive[/red]"
-            redis_details = "Service not running"
-        table.add_row("Redis Cache", redis_display, redis_details)
+        services = tuple(service for _, service in _SERVICES)
+        running = dict(zip(services, self._probe_all(services)))
+        uptimes = self._get_service_uptimes(tuple(service for service in services if running[service]))
+        
+        for label, service in _SERVICES:
+            details = uptimes[service] if running[service] else "Service not running"
+            table.add_row(label, _STATUS_CELL[running[service]], details)
         
         console.print(table)
         console.print()
         
         # Show statistics if services are running
-        if unbound_status:
+        if running[UNBOUND_SERVICE]:
             console.print("─" * 60)
             console.print("[bold]DNS Statistics:[/bold]")
             self._show_quick_stats()
             console.print()
         
-        if redis_status:
+        if running[REDIS_SERVICE]:
             console.print("─" * 60)
             console.print("[bold]Cache Statistics:[/bold]")
             self._show_cache_stats()
@@ -308,32 +458,45 @@ class UnboundManagerCLI:
         if result == SubMenu.QUIT:
             return False
     
-    def _get_service_uptime(self, service: str) -> str:
-        """Get service uptime."""
+    def _get_service_uptimes(self, services: Tuple[str, ...]) -> Dict[str, str]:
+        """Get uptime for several services with a single systemctl call."""
+        uptimes = dict.fromkeys(services, "Unknown")
+        if not services:
+            return uptimes
+        
         try:
             result = run_command(
-                ["systemctl", "show", service, "--property=ActiveEnterTimestamp"],
+                ["systemctl", "show", "--property=ActiveEnterTimestamp", *services],
                 check=False
             )
-            if result.returncode == 0 and "=" in result.stdout:
-                timestamp = result.stdout.split("=")[1].strip()
-                if timestamp:
-                    import datetime
-                    start_time = datetime.datetime.strptime(
-                        timestamp.split()[1] + " " + timestamp.split()[2],
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    uptime = datetime.datetime.now() - start_time
-                    days = uptime.days
-                    hours = uptime.seconds // 3600
-                    minutes = (uptime.seconds % 3600) // 60
-                    
-                    if days > 0:
-                        return f"Up {days}d {hours}h {minutes}m"
-                    elif hours > 0:
-                        return f"Up {hours}h {minutes}m"
-                    else:
-                        return f"Up {minutes}m"
+            if result.returncode == 0:
+                # One "Property=value" block per unit, separated by blank lines
+                blocks = result.stdout.strip().split("\n\n")
+                for service, block in zip(services, blocks):
+                    uptimes[service] = self._format_uptime(block.partition("=")[2].strip())
+        except Exception:
+            pass
+        return uptimes
+    
+    def _format_uptime(self, timestamp: str) -> str:
+        """Format a systemd timestamp as time elapsed since then."""
+        try:
+            if timestamp:
+                start_time = datetime.datetime.strptime(
+                    timestamp.split()[1] + " " + timestamp.split()[2],
+                    "%Y-%m-%d %H:%M:%S"
+                )
+                uptime = datetime.datetime.now() - start_time
+                days = uptime.days
+                hours = uptime.seconds // 3600
+                minutes = (uptime.seconds % 3600) // 60
+                
+                if days > 0:
+                    return f"Up {days}d {hours}h {minutes}m"
+                elif hours > 0:
+                    return f"Up {hours}h {minutes}m"
+                else:
+                    return f"Up {minutes}m"
         except Exception:
             pass
         return "Unknown"
@@ -341,10 +504,8 @@ class UnboundManagerCLI:
     def _show_quick_stats(self) -> None:
         """Show quick DNS statistics."""
         try:
-            result = run_command(["unbound-control", "stats"], check=False)
-            if result.returncode == 0:
-                stats = parse_unbound_stats(result.stdout)
-                
+            stats = get_unbound_stats(_QUICK_STATS_KEYS)
+            if stats is not None:
                 queries = stats.get("total.num.queries", "0")
                 cache_hits = stats.get("total.num.cachehits", "0")
                 
@@ -385,27 +546,43 @@ class UnboundManagerCLI:
     
     def manage_services_quick(self) -> None:
         """Quick service management using standardized submenu."""
-        from .utils import restart_service
-        
         # Get current status for display
-        unbound_running = check_service_status(UNBOUND_SERVICE)
-        redis_running = check_service_status(REDIS_SERVICE)
+        unbound_running, redis_running = self._probe_all((UNBOUND_SERVICE, REDIS_SERVICE))
         
         status_desc = (
-            f"Unbound: {'● Running' if unbound_running else '○ Stopped'} | "
-            f"Redis: {'● Running' if redis_running else '○ Stopped'}"
+            f"Unbound: {_STATUS_LABEL[unbound_running]} | "
+            f"Redis: {_STATUS_LABEL[redis_running]}"
         )
         
         def start_all():
-            console.print("[cyan]Starting services...[/cyan]")
-            restart_service(REDIS_SERVICE)
-            restart_service(UNBOUND_SERVICE)
-            print_success("Services started")
+            # Progress refreshes from its own thread, so the spinner keeps
+            # animating while the restart blocks. One systemctl call queues
+            # both restarts as a single transaction, so systemd honours
+            # unbound.service's After=redis-server.service.
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                transient=True,
+            ) as progress:
+                task = progress.add_task("Starting Redis and Unbound...", total=None)
+                try:
+                    run_command(["systemctl", "restart", REDIS_SERVICE, UNBOUND_SERVICE])
+                    time.sleep(2)  # Give services time to start
+                except Exception as e:
+                    console.print(f"[red]Failed to restart services: {e}[/red]")
+                self._invalidate_status(REDIS_SERVICE, UNBOUND_SERVICE)
+                redis_up, unbound_up = self._probe_all((REDIS_SERVICE, UNBOUND_SERVICE))
+                progress.update(task, completed=True)
+            if redis_up and unbound_up:
+                print_success("Services started")
+            else:
+                print_error("Services did not all start; check Service Status for details")
         
         def stop_all():
             console.print("[cyan]Stopping services...[/cyan]")
-            run_command(["systemctl", "stop", UNBOUND_SERVICE])
-            run_command(["systemctl", "stop", REDIS_SERVICE])
+            # systemctl accepts several units, so stop both in one call
+            run_command(["systemctl", "stop", UNBOUND_SERVICE, REDIS_SERVICE])
+            self._invalidate_status(UNBOUND_SERVICE, REDIS_SERVICE)
             console.print("[yellow]Services stopped[/yellow]")
         
         menu = SubMenu("Service Control", status_desc)
@@ -419,50 +596,22 @@ class UnboundManagerCLI:
     
     def manage_services_advanced(self) -> None:
         """Advanced service management using standardized submenu."""
-        from .utils import restart_service
-        
-        def start_unbound():
-            console.print("[cyan]Starting Unbound...[/cyan]")
-            restart_service(UNBOUND_SERVICE)
-            print_success("Unbound started")
-        
-        def stop_unbound():
-            console.print("[cyan]Stopping Unbound...[/cyan]")
-            run_command(["systemctl", "stop", UNBOUND_SERVICE])
-            console.print("[yellow]Unbound stopped[/yellow]")
-        
-        def restart_unbound():
-            console.print("[cyan]Restarting Unbound...[/cyan]")
-            restart_service(UNBOUND_SERVICE)
-            print_success("Unbound restarted")
-        
-        def start_redis():
-            console.print("[cyan]Starting Redis...[/cyan]")
-            restart_service(REDIS_SERVICE)
-            print_success("Redis started")
-        
-        def stop_redis():
-            console.print("[cyan]Stopping Redis...[/cyan]")
-            run_command(["systemctl", "stop", REDIS_SERVICE])
-            console.print("[yellow]Redis stopped[/yellow]")
-        
-        def restart_redis():
-            console.print("[cyan]Restarting Redis...[/cyan]")
-            restart_service(REDIS_SERVICE)
-            print_success("Redis restarted")
-        
-        result = create_submenu("Advanced Service Control", [
-            ("Start Unbound", start_unbound),
-            ("Stop Unbound", stop_unbound),
-            ("Restart Unbound", restart_unbound),
-            ("Start Redis", start_redis),
-            ("Stop Redis", stop_redis),
-            ("Restart Redis", restart_redis),
-        ])
+        result = create_submenu("Advanced Service Control", self._service_options)
         
         if result == SubMenu.QUIT:
             return False
     
+    def _service_action(self, verb: str, service: str, name: str) -> None:
+        """Start, stop or restart a single service."""
+        console.print(f"[cyan]{_ACTION_PROGRESS[verb]} {name}...[/cyan]")
+        if verb == "stop":
+            run_command(["systemctl", "stop", service])
+            self._invalidate_status(service)
+            console.print(f"[yellow]{name} stopped[/yellow]")
+        else:
+            self._record_status(service, restart_service(service))
+            print_success(f"{name} {_ACTION_DONE[verb]}")
+    
     def backup_configuration_interactive(self) -> None:
         """Interactive backup creation."""
         print_header("Create Backup")
@@ -516,7 +665,13 @@ class UnboundManagerCLI:
         def follow_logs():
             console.print("[cyan]Following logs... Press Ctrl+C to stop[/cyan]\n")
             try:
-                run_command(["journalctl", "-u", UNBOUND_SERVICE, "-f"], check=False, capture_output=False)
+                # Inherit the terminal and never time out; Ctrl+C reaches journalctl directly
+                run_command(
+                    ["journalctl", "-u", UNBOUND_SERVICE, "-f"],
+                    check=False,
+                    capture_output=False,
+                    timeout=None,
+                )
             except KeyboardInterrupt:
                 pass
         
@@ -556,39 +711,7 @@ class UnboundManagerCLI:
         """Show help information."""
         print_header("Help")
         
-        help_sections = [
-            ("[bold]Navigation:[/bold]", [
-                "↑/↓ or j/k    Navigate menu",
-                "Enter         Select item",
-                "ESC or b      Go back",
-                "r             Return (in submenus)",
-                "q             Quit program"
-            ]),
-            ("[bold]Quick Keys:[/bold]", [
-                "s             Services (start/stop)",
-                "v             View (status/logs)",
-                "h             Help",
-                "1-9           Quick select"
-            ]),
-            ("[bold]Menu Categories:[/bold]", [
-                "Services       Start/Stop/Restart DNS",
-                "View           Status, Stats, Logs",
-                "Configuration  DNS, Server, Access, Cache",
-                "Testing        Diagnostics & benchmarks",
-                "Backups        Create/Restore backups",
-                "Install/Update Unbound & Manager updates"
-            ])
-        ]
-        
-        for title, items in help_sections:
-            console.print(title)
-            for item in items:
-                console.print(f"  {item}")
-            console.print()
-        
-        console.print("─" * 60)
-        console.print("\n[bold]Documentation:[/bold]")
-        console.print("  https://github.com/regix1/unbound-manager")
+        console.print(_HELP_TEXT)
         pause()
     
     def update_manager(self) -> None:
@@ -596,23 +719,16 @@ class UnboundManagerCLI:
         print_header("Update Manager")
         console.print(f"Current version: [cyan]{APP_VERSION}[/cyan]")
         
-        # Quick version check
+        remote_version = self._get_remote_version()
+        
         update_available = False
-        try:
-            import requests
-            response = requests.get(
-                "https://raw.githubusercontent.com/regix1/unbound-manager/main/VERSION",
-                timeout=(2, 3)
-            )
-            if response.status_code == 200:
-                remote_version = response.text.strip()
-                if remote_version != APP_VERSION:
-                    console.print(f"Latest version:  [yellow]{remote_version}[/yellow]")
-                    update_available = True
-                else:
-                    console.print(f"Latest version:  [green]{remote_version}[/green]")
-        except Exception:
+        if remote_version is None:
             console.print("Latest version:  [dim]unknown[/dim]")
+        elif remote_version != APP_VERSION:
+            console.print(f"Latest version:  [yellow]{remote_version}[/yellow]")
+            update_available = True
+        else:
+            console.print(f"Latest version:  [green]{remote_version}[/green]")
         
         console.print()
         
@@ -634,12 +750,68 @@ class UnboundManagerCLI:
         if result == SubMenu.QUIT:
             return False
     
+    def _get_remote_version(self) -> Optional[str]:
+        """Latest manager version, reusing a recent result where possible."""
+        cached = self._remote_version_cache
+        if cached is not None and time.monotonic() - cached[0] < _REMOTE_VERSION_TTL:
+            return cached[1]
+        
+        # Wait for the check started when the category opened, if any,
+        # rather than sending a second request
+        self._prefetch_remote_version()
+        future, self._remote_version_future = self._remote_version_future, None
+        remote_version = future.result()
+        
+        if remote_version is not None:
+            self._remote_version_cache = (time.monotonic(), remote_version)
+        return remote_version
+    
+    def _fetch_remote_version(self) -> Optional[str]:
+        """Fetch the latest published manager version, or None if unreachable."""
+        try:
+            with urlopen(MANAGER_VERSION_URL, timeout=3) as response:
+                if response.status == 200:
+                    return response.read().decode().strip()
+        except Exception:
+            pass
+        return None
+    
+    def _prefetch_remote_version(self) -> None:
+        """Start fetching the remote version unless it is cached or already in flight."""
+        cached = self._remote_version_cache
+        if cached is not None and time.monotonic() - cached[0] < _REMOTE_VERSION_TTL:
+            return
+        if self._remote_version_future is None:
+            self._remote_version_future = self._probe_pool.submit(self._fetch_remote_version)
+    
+    @staticmethod
+    def _pip_install(progress: Progress, task, label: str, source_dir: Path) -> None:
+        """pip install the source tree, showing its latest output line on the spinner."""
+        progress.update(task, description=label)
+        stream_command(
+            ["pip3", "install", "."],
+            lambda line: progress.update(task, description=f"{label} [dim]{escape(line[:60])}[/dim]"),
+            cwd=source_dir,
+        )
+        progress.update(task, description=label)
+    
+    def _finish_update(self) -> None:
+        """Report a successful update and offer to restart into the new version."""
+        self._remote_version_cache = None
+        print_success("Update complete!")
+        
+        if prompt_yes_no("Restart Unbound Manager now?", default=True):
+            # Replace this process so the freshly installed package is imported
+            sys.stdout.flush()
+            os.execv(_RESTART_ARGV[0], _RESTART_ARGV)
+        console.print("[dim]Restart the program to use the new version.[/dim]")
+    
     def perform_update(self) -> None:
         """Perform the update - works for both dev and production installs."""
         console.print("\n[cyan]Updating...[/cyan]")
         
         try:
-            source_dir = Path.home() / "unbound-manager"
+            source_dir = SOURCE_DIR
             
             # Check if source directory exists with git
             if source_dir.exists() and (source_dir / ".git").exists():
@@ -647,32 +819,29 @@ class UnboundManagerCLI:
                 with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
                     task = progress.add_task("Pulling latest changes...", total=None)
                     run_command(["git", "pull"], cwd=source_dir)
-                    progress.update(task, description="Reinstalling package...")
                     # Use regular install to ensure it works for both dev and production
-                    run_command(["pip3", "install", "."], cwd=source_dir)
+                    self._pip_install(progress, task, "Reinstalling package...", source_dir)
                     progress.update(task, completed=True)
                 
-                print_success("Update complete! Please restart the program.")
+                self._finish_update()
             else:
                 # No source directory - clone it first
                 console.print("[cyan]Source directory not found. Cloning repository...[/cyan]")
                 
                 # Remove old directory if it exists but isn't a git repo
                 if source_dir.exists():
-                    import shutil
                     shutil.rmtree(source_dir)
                 
                 with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
                     task = progress.add_task("Cloning repository...", total=None)
                     run_command(
                         ["git", "clone", "https://github.com/regix1/unbound-manager.git"],
-                        cwd=Path.home()
+                        cwd=SOURCE_DIR.parent
                     )
-                    progress.update(task, description="Installing package...")
-                    run_command(["pip3", "install", "."], cwd=source_dir)
+                    self._pip_install(progress, task, "Installing package...", source_dir)
                     progress.update(task, completed=True)
                 
-                print_success("Update complete! Please restart the program.")
+                self._finish_update()
                 
         except Exception as e:
             console.print(f"[red]Update failed: {e}[/red]")
@@ -711,8 +880,9 @@ class UnboundManagerCLI:
         
         # Restart Unbound to apply changes
         print_info("Restarting Unbound...")
-        from .utils import restart_service
-        if restart_service(UNBOUND_SERVICE):
+        restarted = restart_service(UNBOUND_SERVICE)
+        self._record_status(UNBOUND_SERVICE, restarted)
+        if restarted:
             print_success("Unbound restarted successfully")
             
             # Test DNS resolution
@@ -763,7 +933,10 @@ class UnboundManagerCLI:
         check_root()
         
         while True:
-            self.show_banner()
+            # Render the banner (and probe status) once per pass; the menu
+            # draws it in the same write as each frame and returns after an
+            # action, which may have changed the status
+            self.menu.header = self.render_banner()
             
             # Run the interactive menu
             result = self.menu.run()
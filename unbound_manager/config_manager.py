@@ -2,173 +2,400 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
 import os
+import re
 import shutil
 import tempfile
 import subprocess
-import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import yaml
-from jinja2 import Template, Environment, FileSystemLoader, ChoiceLoader
-from rich.console import Console
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
-from .constants import UNBOUND_DIR, UNBOUND_CONF, UNBOUND_CONF_D, DEFAULT_CONFIG
-from .utils import set_file_permissions, ensure_directory, prompt_yes_no, get_server_ip
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+from .constants import (
+    UNBOUND_DIR, UNBOUND_CONF, UNBOUND_CONF_D, DEFAULT_CONFIG, DNS_PROVIDERS, DNS_PROVIDER_ORDER,
+    PROJECT_DIR, SOURCE_DIR, TEMPLATES_DIR, SYSTEMD_DIR, CACHE_DIR, JINJA_CACHE_DIR, CONFIG_CACHE,
+)
+from .utils import (
+    set_file_permissions, ensure_directory, prompt_yes_no, get_server_ip, run_command, atomic_write_text,
+    private_cache_dir, is_private,
+)
 from .menu_system import SubMenu, create_submenu
-from .ui import print_header, pause, print_success, print_error, print_nav_options, get_choice
+from .ui import print_header, pause, print_success, print_error, print_nav_options, get_choice, console
 
-console = Console()
+# Fixed prompt choices, built once rather than on every prompt
+_ACCESS_CONTROL_CHOICES = ("1", "2", "3", "r", "q")
+_PROVIDER_CHOICES = ("r", "q") + tuple(str(i) for i in range(1, len(DNS_PROVIDER_ORDER) + 1))
 
+# Configs rendered without any context: name -> (label, template, output, context)
+_STATIC_CONFIGS = {
+    "main": ("main configuration file", "unbound.conf.j2", UNBOUND_CONF, {"version": "2.0.0"}),
+    "control": ("control configuration", "control.conf.j2", UNBOUND_CONF_D / "control.conf", {}),
+    "dnssec": ("DNSSEC configuration", "dnssec.conf.j2", UNBOUND_CONF_D / "dnssec.conf", {}),
+    "redis": ("Redis configuration", "redis.conf.j2", UNBOUND_CONF_D / "redis.conf", {}),
+    "root-hints": ("root hints configuration", "root-hints.conf.j2", UNBOUND_CONF_D / "root-hints.conf", {}),
+}
 
-@lru_cache(maxsize=1)
-def _get_template_env() -> Environment:
-    """Get cached Jinja2 template environment."""
+# Quick-edit parameters prompted for as numbers / as yes-no confirmations
+_NUMERIC_PARAMS = frozenset({"port", "num-threads", "verbosity", "val-log-level"})
+_BOOL_PARAMS = frozenset({
+    "do-ip4", "do-ip6", "prefetch", "serve-expired", "val-permissive-mode",
+    "trust-anchor-signaling", "harden-dnssec-stripped", "redis-expire-records",
+})
+
+# An active "access-control: <network> <action>" line in server.conf
+_ACL_RE = re.compile(r'^[ \t]*access-control:[ \t]*(\S+)[ \t]+(\S+).*$', re.MULTILINE)
+_ACL_LINE_RE = re.compile(r'^[ \t]*access-control:.*\n?', re.MULTILINE)
+
+# Rules restored by "Reset Defaults", and their preformatted config lines
+_DEFAULT_ACL_RULES = (
+    ("127.0.0.0/8", "allow"),
+    ("10.0.0.0/8", "allow"),
+    ("172.16.0.0/12", "allow"),
+    ("192.168.0.0/16", "allow"),
+)
+_DEFAULT_ACL_LINES = tuple(
+    f"    access-control: {network} {action}\n" for network, action in _DEFAULT_ACL_RULES
+)
+
+
+def _params_read_re(params: tuple) -> re.Pattern:
+    """Compiled pattern capturing (name, value) of any "param: value" line for params."""
+    names = '|'.join(re.escape(param) for param in params)
+    return re.compile(rf'^\s*({names}):\s*(.+)$', re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def _yaml_codec() -> tuple:
+    """Import PyYAML on first use; returns (yaml, loader, dumper)."""
+    import yaml
+    # Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+def _read_config_sidecar(key: tuple) -> Optional[Dict[str, Any]]:
+    """Parsed config.yaml from the JSON cache, if it matches (mtime_ns, size).
+    
+    Its values end up in root-rendered configs, so it is only trusted if
+    both it and its directory are private to us (see is_private).
+    """
+    try:
+        if not is_private(os.lstat(CACHE_DIR)):
+            return None
+        with open(CONFIG_CACHE, 'rb') as f:
+            if not is_private(os.fstat(f.fileno())):
+                return None
+            cached = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if cached.get("key") != list(key):
+        return None
+    return cached.get("config")
+
+
+def _write_config_sidecar(key: tuple, config: Dict[str, Any]) -> None:
+    """Store a parsed config.yaml as JSON; skipped if JSON can't represent it exactly."""
+    try:
+        text = json.dumps({"key": list(key), "config": config})
+        if json.loads(text)["config"] != config:
+            return
+        if private_cache_dir(CACHE_DIR):
+            atomic_write_text(CONFIG_CACHE, text)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _forward_addr_line(server: dict, default_port: int, is_encrypted: bool) -> str:
+    """Format one forward-addr line, with the TLS auth name when encrypted."""
+    ip = server.get("ip", "")
+    port = server.get("port", default_port)
+    hostname = server.get("hostname")
+    if is_encrypted and hostname:
+        return f"    forward-addr: {ip}@{port}#{hostname}"
+    return f"    forward-addr: {ip}@{port}" if port != 53 else f"    forward-addr: {ip}"
+
+
+def _read_head(path: Path, size: int = 65536) -> tuple:
+    """Return (text of the first size bytes, whether that is the whole file)."""
+    with open(path, 'rb') as f:
+        data = f.read(size)
+    if len(data) < size:
+        return data.decode('utf-8'), True
+    # Drop the trailing partial line so no value is read truncated
+    return data[:data.rfind(b'\n') + 1].decode('utf-8', 'replace'), False
+
+
+@lru_cache(maxsize=4)
+def _render_provider_table(width: int) -> str:
+    """Render the static provider list once per terminal width."""
+    table = Table(show_header=True, header_style="bold magenta", box=None)
+    table.add_column("#", style="cyan", width=3)
+    table.add_column("Provider", width=25)
+    table.add_column("Security", width=12)
+    
+    for i, provider_key in enumerate(DNS_PROVIDER_ORDER, 1):
+        provider = DNS_PROVIDERS[provider_key]
+        security = "[green]Encrypted[/green]" if provider["encrypted"] else "[yellow]Unencrypted[/yellow]"
+        if provider_key == "none":
+            security = "[blue]Direct[/blue]"
+        table.add_row(str(i), provider["name"], security)
+    
+    with console.capture() as capture:
+        console.print("[dim]Encrypted (DoT) = Protected from eavesdropping[/dim]")
+        console.print("[dim]Unencrypted = Faster but visible to ISP[/dim]")
+        console.print()
+        console.print(table)
+        console.print()
+    return capture.get()
+
+
+@lru_cache(maxsize=8)
+def _find_editor(name: str) -> Optional[str]:
+    """Absolute path of an editor on PATH, or None; looked up once per name."""
+    return shutil.which(name)
+
+
+def _scan_files(directory: Path) -> List[os.DirEntry]:
+    """Regular files in a directory, or an empty list if it doesn't exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry for entry in entries if entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _template_dir_candidates():
+    """Yield (kind, path) for every place the templates may be installed.
+    
+    Ordered from most to least likely, so the globbing and site lookups for
+    system-wide installs only run if nothing earlier matched.
+    """
     import glob
     import site
     
-    # Setup Jinja2 environment with multiple possible paths
-    possible_template_dirs = [
-        Path(__file__).parent.parent / "data" / "templates",
-        Path(__file__).parent.parent / "data" / "systemd",
-        Path(__file__).parent.parent / "templates",
-        Path.home() / "unbound-manager" / "data" / "templates",
-        Path.home() / "unbound-manager" / "data" / "systemd",
-        Path.home() / "unbound-manager" / "templates",
-    ]
+    yield "templates", TEMPLATES_DIR
+    yield "systemd", SYSTEMD_DIR
+    yield "templates", PROJECT_DIR / "templates"
+    yield "templates", SOURCE_DIR / "data" / "templates"
+    yield "systemd", SOURCE_DIR / "data" / "systemd"
+    yield "templates", SOURCE_DIR / "templates"
     
     # Dynamically find Python site-packages directories
     for base_path in ["/usr/local/lib", "/usr/lib"]:
-        python_dirs = glob.glob(f"{base_path}/python3.*")
-        for python_dir in python_dirs:
-            possible_template_dirs.extend([
-                Path(python_dir) / "dist-packages" / "data" / "templates",
-                Path(python_dir) / "dist-packages" / "data" / "systemd",
-                Path(python_dir) / "site-packages" / "data" / "templates",
-                Path(python_dir) / "site-packages" / "data" / "systemd",
-            ])
+        for python_dir in glob.glob(f"{base_path}/python3.*"):
+            for packages in ("dist-packages", "site-packages"):
+                yield "templates", Path(python_dir) / packages / "data" / "templates"
+                yield "systemd", Path(python_dir) / packages / "data" / "systemd"
     
     # Also check system site-packages
     for site_dir in site.getsitepackages():
-        possible_template_dirs.extend([
-            Path(site_dir) / "data" / "templates",
-            Path(site_dir) / "data" / "systemd",
-        ])
-    
-    # Collect all existing directories
-    loaders = []
-    for path in possible_template_dirs:
-        if path.exists():
-            loaders.append(FileSystemLoader(str(path)))
-    
-    # Try package resources as fallback
-    if not loaders:
-        try:
-            import pkg_resources
-            for subdir in ["../data/templates", "../data/systemd", "../templates"]:
-                if pkg_resources.resource_exists("unbound_manager", subdir):
-                    resource_path = Path(pkg_resources.resource_filename("unbound_manager", subdir))
-                    if resource_path.exists():
-                        loaders.append(FileSystemLoader(str(resource_path)))
-        except Exception:
-            pass
+        yield "templates", Path(site_dir) / "data" / "templates"
+        yield "systemd", Path(site_dir) / "data" / "systemd"
+
+
+@lru_cache(maxsize=1)
+def _get_template_env() -> Environment:
+    """Get cached Jinja2 template environment."""
+    from jinja2 import Environment, FileSystemLoader, ChoiceLoader, FileSystemBytecodeCache
+    
+    # Take the first existing directory of each kind and stop probing
+    found = {}
+    searched = []
+    for kind, path in _template_dir_candidates():
+        searched.append(path)
+        if kind not in found and os.path.isdir(path):
+            found[kind] = path
+            if len(found) == 2:
+                break
+    loaders = [FileSystemLoader(str(path)) for path in found.values()]
     
     if not loaders:
         raise FileNotFoundError(
-            f"Template directory not found. Searched {len(possible_template_dirs)} locations.\n"
+            f"Template directory not found. Searched {len(searched)} locations.\n"
             "Checked paths include:\n" + 
-            "\n".join(str(p) for p in possible_template_dirs[:10]) +
+            "\n".join(str(p) for p in searched[:10]) +
             "\n... and more"
         )
     
+    # Keep compiled template bytecode between runs, but only in a directory
+    # nobody else can write to: Jinja2 executes what it finds there
+    bytecode_cache = None
+    if private_cache_dir(CACHE_DIR) and private_cache_dir(JINJA_CACHE_DIR):
+        bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+    
     return Environment(
         loader=ChoiceLoader(loaders),
+        bytecode_cache=bytecode_cache,
         trim_blocks=True,
         lstrip_blocks=True,
+        # Templates are package data; don't re-stat them on every render
+        # and never evict a compiled one
+        auto_reload=False,
+        cache_size=-1,
     )
 
 
 class ConfigManager:
     """Manage Unbound configuration files with editing capabilities."""
     
+    # Parameters offered by quick_edit_config, per file
+    editable_params = {
+        "server.conf": {
+            "interface": "Network interface IP (e.g., 192.168.1.1)",
+            "port": "DNS port (default: 53)",
+            "num-threads": "Number of threads (based on CPU cores)",
+            "msg-cache-size": "Message cache size (e.g., 64m, 256m)",
+            "rrset-cache-size": "RRset cache size (e.g., 128m, 512m)",
+            "verbosity": "Log verbosity (0-5, default: 1)",
+            "do-ip4": "Enable IPv4 (yes/no)",
+            "do-ip6": "Enable IPv6 (yes/no)",
+            "prefetch": "Enable prefetching (yes/no)",
+            "serve-expired": "Serve expired records (yes/no)",
+        },
+        "dnssec.conf": {
+            "val-permissive-mode": "DNSSEC permissive mode (yes/no)",
+            "val-log-level": "DNSSEC validation log level (0-2)",
+            "trust-anchor-signaling": "Trust anchor signaling (yes/no)",
+            "harden-dnssec-stripped": "Harden against DNSSEC stripping (yes/no)",
+        },
+        "redis.conf": {
+            "redis-server-path": "Redis socket path",
+            "redis-timeout": "Redis timeout in milliseconds",
+            "redis-expire-records": "Let Redis expire records (yes/no)",
+        }
+    }
+    # One compiled "param: value" reader per editable file
+    _param_patterns = {
+        file_name: _params_read_re(tuple(params)) for file_name, params in editable_params.items()
+    }
+    
     def __init__(self):
         """Initialize the configuration manager."""
-        # Use cached template environment
-        self.env = _get_template_env()
-        
-        # Define editable configuration parameters
-        self.editable_params = {
-            "server.conf": {
-                "interface": "Network interface IP (e.g., 192.168.1.1)",
-                "port": "DNS port (default: 53)",
-                "num-threads": "Number of threads (based on CPU cores)",
-                "msg-cache-size": "Message cache size (e.g., 64m, 256m)",
-                "rrset-cache-size": "RRset cache size (e.g., 128m, 512m)",
-                "verbosity": "Log verbosity (0-5, default: 1)",
-                "do-ip4": "Enable IPv4 (yes/no)",
-                "do-ip6": "Enable IPv6 (yes/no)",
-                "prefetch": "Enable prefetching (yes/no)",
-                "serve-expired": "Serve expired records (yes/no)",
-            },
-            "dnssec.conf": {
-                "val-permissive-mode": "DNSSEC permissive mode (yes/no)",
-                "val-log-level": "DNSSEC validation log level (0-2)",
-                "trust-anchor-signaling": "Trust anchor signaling (yes/no)",
-                "harden-dnssec-stripped": "Harden against DNSSEC stripping (yes/no)",
-            },
-            "redis.conf": {
-                "redis-server-path": "Redis socket path",
-                "redis-timeout": "Redis timeout in milliseconds",
-                "redis-expire-records": "Let Redis expire records (yes/no)",
-            }
-        }
+        # Jinja2 environment, built on first render (see env)
+        self._env: Optional[Environment] = None
+        # ((mtime_ns, size), parsed config.yaml) from the last load or save
+        self._config_cache: Optional[tuple] = None
+        # Compiled templates by name, see render_template
+        self._templates: Dict[str, Template] = {}
+        # (mtime_ns of conf.d, its *.conf files), see _list_conf_files
+        self._conf_files: Optional[tuple] = None
+    
+    @property
+    def env(self) -> Environment:
+        """Template environment; importing Jinja2 waits until a render needs it."""
+        if self._env is None:
+            self._env = _get_template_env()
+        return self._env
     
     def load_config(self) -> Dict[str, Any]:
         """Load current configuration or defaults."""
         config_file = UNBOUND_DIR / "config.yaml"
         
-        if config_file.exists():
+        try:
+            st = os.stat(config_file)
+        except FileNotFoundError:
+            return copy.deepcopy(DEFAULT_CONFIG)
+        
+        # Reuse the last parse while the file is unchanged
+        key = (st.st_mtime_ns, st.st_size)
+        if self._config_cache is not None and self._config_cache[0] == key:
+            return copy.deepcopy(self._config_cache[1])
+        
+        # Then the JSON copy left by an earlier run, and only then parse YAML
+        config = _read_config_sidecar(key)
+        if config is None:
+            yaml, loader, _ = _yaml_codec()
             try:
-                with open(config_file, 'r') as f:
-                    config = yaml.safe_load(f)
-                    return config if config else DEFAULT_CONFIG.copy()
+                config = yaml.load(config_file.read_bytes(), Loader=loader)
             except yaml.YAMLError as e:
                 console.print(f"[red]Invalid YAML in config.yaml: {e}[/red]")
                 console.print("[yellow]Using default configuration[/yellow]")
-                return DEFAULT_CONFIG.copy()
+                return copy.deepcopy(DEFAULT_CONFIG)
+            
+            if not config:
+                config = DEFAULT_CONFIG
+            _write_config_sidecar(key, config)
         
-        return DEFAULT_CONFIG.copy()
+        self._config_cache = (key, config)
+        return copy.deepcopy(config)
     
     def save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to YAML file."""
         config_file = UNBOUND_DIR / "config.yaml"
         
-        with open(config_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        # Skip the dump and write if the file still holds exactly this config
+        if self._config_cache is not None and self._config_cache[1] == config:
+            try:
+                st = os.stat(config_file)
+            except FileNotFoundError:
+                st = None
+            if st is not None and (st.st_mtime_ns, st.st_size) == self._config_cache[0]:
+                return
+        
+        yaml, _, dumper = _yaml_codec()
+        atomic_write_text(config_file, yaml.dump(config, Dumper=dumper, default_flow_style=False))
+        
+        # Remember what was written, and refresh the JSON copy so the next
+        # run needn't parse the YAML
+        st = os.stat(config_file)
+        key = (st.st_mtime_ns, st.st_size)
+        self._config_cache = (key, copy.deepcopy(config))
+        _write_config_sidecar(key, config)
         
         set_file_permissions(config_file)
     
     def render_template(self, template_name: str, output_path: Path, context: Dict[str, Any]) -> None:
         """Render a Jinja2 template to a file."""
-        template = self.env.get_template(template_name)
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._templates[template_name] = self.env.get_template(template_name)
         content = template.render(**context)
         
         # Ensure directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write file
-        with open(output_path, 'w') as f:
-            f.write(content)
+        # Write file, unless it already holds exactly this content
+        try:
+            current = output_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            current = None
+        if current != content:
+            atomic_write_text(output_path, content)
+            self._conf_files = None
         
         # Set permissions
         set_file_permissions(output_path)
     
+    def _list_conf_files(self) -> tuple:
+        """The *.conf files in conf.d, rescanned only when the directory changes."""
+        try:
+            mtime = os.stat(UNBOUND_CONF_D).st_mtime_ns
+        except FileNotFoundError:
+            return ()
+        if self._conf_files is None or self._conf_files[0] != mtime:
+            files = tuple(
+                Path(entry.path) for entry in _scan_files(UNBOUND_CONF_D)
+                if entry.name.endswith(".conf")
+            )
+            self._conf_files = (mtime, files)
+        return self._conf_files[1]
+    
     def edit_configuration_interactive(self, file_name: str) -> None:
         """Interactive configuration editor using standardized submenu."""
         file_path = UNBOUND_CONF_D / file_name
@@ -196,21 +423,20 @@ class ConfigManager:
             self.open_in_editor(file_path, "nano")
             return
         
-        # Read current configuration
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
-        # Parse current values
-        current_values = {}
-        for param in self.editable_params[file_name]:
-            import re
-            # Look for the parameter in the config
-            pattern = rf'^\s*{re.escape(param)}:\s*(.+)$'
-            match = re.search(pattern, content, re.MULTILINE)
-            if match:
-                current_values[param] = match.group(1).strip().strip('"')
-            else:
-                current_values[param] = "not set"
+        # Parse current values from the head of the file, falling back to the
+        # whole file only if some parameter wasn't found there
+        current_values = dict.fromkeys(self.editable_params[file_name], "not set")
+        pattern = self._param_patterns[file_name]
+        head, complete = _read_head(file_path)
+        found = set()
+        for text in (head,) if complete else (head, file_path.read_text(encoding='utf-8')):
+            for match in pattern.finditer(text):
+                param = match.group(1)
+                if param not in found:
+                    found.add(param)
+                    current_values[param] = match.group(2).strip().strip('"')
+            if len(found) == len(current_values):
+                break
         
         # Display current values
         console.print(Panel.fit(
@@ -241,7 +467,7 @@ class ConfigManager:
             console.print(f"Current: [yellow]{current}[/yellow]")
             
             # Get new value
-            if param in ["port", "num-threads", "verbosity", "val-log-level"]:
+            if param in _NUMERIC_PARAMS:
                 # Numeric values
                 try:
                     if current != "not set":
@@ -253,8 +479,7 @@ class ConfigManager:
                         changes[param] = new_value
                 except Exception:
                     pass
-            elif param in ["do-ip4", "do-ip6", "prefetch", "serve-expired", "val-permissive-mode", 
-                         "trust-anchor-signaling", "harden-dnssec-stripped", "redis-expire-records"]:
+            elif param in _BOOL_PARAMS:
                 # Boolean values
                 current_bool = current.lower() == "yes" if current != "not set" else False
                 new_value = Confirm.ask(f"Enable {param}?", default=current_bool)
@@ -285,26 +510,30 @@ class ConfigManager:
             
             if prompt_yes_no("\nApply these changes?", default=True):
                 # Backup current config
-                backup_path = file_path.with_suffix(f'.conf.backup.{int(time.time())}')
-                shutil.copy2(file_path, backup_path)
-                print_success(f"Backup created: {backup_path.name}")
+                original = file_path.read_bytes()
+                content = original.decode('utf-8')
+                self._backup_original(file_path, original, link=True)
+                
+                # Apply all changes in a single pass over the file
+                pattern = re.compile(
+                    r'^(\s*)(' + '|'.join(re.escape(p) for p in changes) + r'):\s*.+$',
+                    re.MULTILINE,
+                )
+                matched = set()
+                
+                def replace(match):
+                    param = match.group(2)
+                    matched.add(param)
+                    return f"{match.group(1)}{param}: {changes[param]}"
                 
-                # Apply changes
-                new_content = content
+                new_content = pattern.sub(replace, content)
                 for param, value in changes.items():
-                    import re
-                    pattern = rf'^(\s*){re.escape(param)}:\s*.+$'
-                    replacement = rf'\1{param}: {value}'
-                    
-                    if re.search(pattern, new_content, re.MULTILINE):
-                        new_content = re.sub(pattern, replacement, new_content, flags=re.MULTILINE)
-                    else:
+                    if param not in matched:
                         # Add parameter if it doesn't exist
                         new_content += f"\n    {param}: {value}"
                 
                 # Write new configuration
-                with open(file_path, 'w') as f:
-                    f.write(new_content)
+                atomic_write_text(file_path, new_content)
                 
                 set_file_permissions(file_path)
                 print_success("Configuration updated successfully")
@@ -316,16 +545,38 @@ class ConfigManager:
         else:
             console.print("[yellow]No changes made[/yellow]")
     
+    def _backup_original(self, file_path: Path, original: bytes, link: bool = False) -> None:
+        """Save a config file's pre-edit content, once per distinct content.
+        
+        With ``link`` the backup is a hardlink to the current file. Only use it
+        when the file still holds ``original`` and will be replaced by rename
+        (atomic_write_text); editors such as nano rewrite the inode in place.
+        """
+        digest = hashlib.blake2b(original, digest_size=8).hexdigest()
+        backup_path = file_path.with_suffix(f'.conf.backup.{digest}')
+        if backup_path.exists():
+            console.print(f"[dim]Backup already exists: {backup_path.name}[/dim]")
+            return
+        
+        if link:
+            try:
+                os.link(file_path, backup_path)
+                print_success(f"Backup created: {backup_path.name}")
+                return
+            except OSError:
+                pass  # No hardlinks here, fall back to a copy
+        
+        backup_path.write_bytes(original)
+        shutil.copymode(file_path, backup_path)
+        print_success(f"Backup created: {backup_path.name}")
+    
     def open_in_editor(self, file_path: Path, editor: str = "nano") -> None:
         """Open configuration file in external editor."""
-        # Create backup before editing
-        backup_path = file_path.with_suffix(f'.conf.backup.{int(time.time())}')
-        shutil.copy2(file_path, backup_path)
-        print_success(f"Backup created: {backup_path.name}")
+        # Keep the original so a backup can be made if the file is changed
+        original = file_path.read_bytes()
         
         # Check if editor is available
-        editor_check = subprocess.run(["which", editor], capture_output=True, text=True)
-        if editor_check.returncode != 0:
+        if _find_editor(editor) is None:
             console.print(f"[yellow]{editor} not found, trying nano...[/yellow]")
             editor = "nano"
         
@@ -337,6 +588,11 @@ class ConfigManager:
             subprocess.run([editor, str(file_path)])
             console.print("\n[green]✓[/green] Editor closed")
             
+            if file_path.read_bytes() == original:
+                console.print("[dim]No changes made[/dim]")
+                return
+            self._backup_original(file_path, original)
+            
             # Validate configuration after editing
             if prompt_yes_no("Validate configuration now?", default=True):
                 self.validate_configuration()
@@ -345,8 +601,7 @@ class ConfigManager:
     
     def view_configuration_file(self, file_path: Path) -> None:
         """View configuration file with syntax highlighting."""
-        with open(file_path, 'r') as f:
-            content = f.read()
+        content = file_path.read_text(encoding='utf-8')
         
         syntax = Syntax(content, "yaml", theme="monokai", line_numbers=True)
         console.print(Panel(syntax, title=f"[bold cyan]{file_path.name}[/bold cyan]", border_style="cyan"))
@@ -355,15 +610,12 @@ class ConfigManager:
         """Edit access control rules using standardized submenu."""
         server_conf = UNBOUND_CONF_D / "server.conf"
         
-        # Read current access control rules
-        current_rules = []
-        if server_conf.exists():
-            with open(server_conf, 'r') as f:
-                for line in f:
-                    if 'access-control:' in line:
-                        parts = line.strip().split('access-control:')[1].strip().split()
-                        if len(parts) >= 2:
-                            current_rules.append((parts[0], parts[1]))
+        # Read server.conf once; the rules and any rewrite both come from it
+        try:
+            text = server_conf.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            text = None
+        current_rules = _ACL_RE.findall(text) if text is not None else []
         
         # Display current rules
         print_header("Access Control Rules")
@@ -387,7 +639,7 @@ class ConfigManager:
             network = Prompt.ask("Network (e.g., 192.168.1.0/24)")
             action = Prompt.ask("Action", choices=["allow", "deny", "refuse"], default="allow")
             current_rules.append((network, action))
-            self._update_access_control(current_rules)
+            self._update_access_control(text, current_rules)
         
         def remove_rule():
             if not current_rules:
@@ -398,16 +650,12 @@ class ConfigManager:
                 choices=[str(i) for i in range(1, len(current_rules) + 1)]
             )
             del current_rules[rule_num - 1]
-            self._update_access_control(current_rules)
+            self._update_access_control(text, current_rules)
         
         def reset_rules():
-            default_rules = [
-                ("127.0.0.0/8", "allow"),
-                ("10.0.0.0/8", "allow"),
-                ("172.16.0.0/12", "allow"),
-                ("192.168.0.0/16", "allow"),
-            ]
-            self._update_access_control(default_rules)
+            # Write the shipped rules, then check the whole file once
+            if self._update_access_control(text, _DEFAULT_ACL_RULES, validate=False):
+                self.validate_configuration()
         
         # Show options after the table
         console.print("  [1] Add Rule")
@@ -416,7 +664,7 @@ class ConfigManager:
         console.print()
         print_nav_options()
         
-        choice = get_choice("Select", ["1", "2", "3", "r", "q"])
+        choice = get_choice("Select", _ACCESS_CONTROL_CHOICES)
         
         if choice == "q":
             return False
@@ -427,25 +675,19 @@ class ConfigManager:
         elif choice == "3":
             reset_rules()
     
-    def _update_access_control(self, rules: List[tuple]) -> None:
-        """Update access control rules in configuration."""
+    def _update_access_control(self, text: Optional[str], rules: List[tuple], validate: bool = True) -> bool:
+        """Rewrite server.conf from its current text with the given rules, then validate unless told not to.
+        
+        Returns whether the file was written.
+        """
         server_conf = UNBOUND_CONF_D / "server.conf"
         
-        if not server_conf.exists():
+        if text is None:
             console.print("[red]Server configuration not found[/red]")
-            return
-        
-        # Read current config
-        with open(server_conf, 'r') as f:
-            lines = f.readlines()
+            return False
         
-        # Remove old access-control lines
-        new_lines = []
-        skip_next = False
-        for line in lines:
-            if 'access-control:' not in line and not skip_next:
-                new_lines.append(line)
-            skip_next = False
+        # Drop the old access-control lines
+        new_lines = _ACL_LINE_RE.sub('', text).splitlines(keepends=True)
         
         # Find where to insert new rules (after "# Access Control" comment)
         insert_index = -1
@@ -454,38 +696,40 @@ class ConfigManager:
                 insert_index = i + 1
                 break
         
+        if tuple(rules) == _DEFAULT_ACL_RULES:
+            inserted = list(_DEFAULT_ACL_LINES)
+        else:
+            inserted = [f"    access-control: {network} {action}\n" for network, action in rules]
+        
         if insert_index == -1:
             # Add at the end of server section
             for i, line in enumerate(new_lines):
                 if line.strip() == '' and i > 0:
                     insert_index = i
-                    new_lines.insert(insert_index, "    # Access Control\n")
-                    insert_index += 1
+                    inserted.insert(0, "    # Access Control\n")
                     break
         
-        # Insert new rules
-        for network, action in rules:
-            new_lines.insert(insert_index, f"    access-control: {network} {action}\n")
-            insert_index += 1
+        # Splice the new rules in with one list build
+        new_lines = new_lines[:insert_index] + inserted + new_lines[insert_index:]
         
         # Write back
-        with open(server_conf, 'w') as f:
-            f.writelines(new_lines)
+        atomic_write_text(server_conf, "".join(new_lines))
         
         print_success("Access control rules updated")
-        self.validate_configuration()
+        if validate:
+            self.validate_configuration()
+        return True
+    
+    def _create_static_config(self, name: str) -> None:
+        """Render one of the context-free configs listed in _STATIC_CONFIGS."""
+        label, template_name, output_path, context = _STATIC_CONFIGS[name]
+        console.print(f"[cyan]Creating {label}...[/cyan]")
+        self.render_template(template_name, output_path, context)
+        print_success(f"{label[:1].upper()}{label[1:]} created")
     
     def create_main_config(self) -> None:
         """Create main unbound.conf file."""
-        console.print("[cyan]Creating main configuration file...[/cyan]")
-        
-        self.render_template(
-            "unbound.conf.j2",
-            UNBOUND_CONF,
-            {"version": "2.0.0"}
-        )
-        
-        print_success("Main configuration created")
+        self._create_static_config("main")
     
     def create_server_config(self, server_ip: str) -> None:
         """Create server configuration."""
@@ -505,69 +749,38 @@ class ConfigManager:
     
     def create_control_config(self) -> None:
         """Create remote control configuration."""
-        console.print("[cyan]Creating control configuration...[/cyan]")
-        
-        self.render_template(
-            "control.conf.j2",
-            UNBOUND_CONF_D / "control.conf",
-            {}
-        )
-        
-        print_success("Control configuration created")
+        self._create_static_config("control")
     
     def create_dnssec_config(self) -> None:
         """Create DNSSEC configuration."""
-        console.print("[cyan]Creating DNSSEC configuration...[/cyan]")
-        
-        self.render_template(
-            "dnssec.conf.j2",
-            UNBOUND_CONF_D / "dnssec.conf",
-            {}
-        )
-        
-        print_success("DNSSEC configuration created")
+        self._create_static_config("dnssec")
     
     def create_redis_config(self) -> None:
         """Create Redis cachedb configuration."""
-        console.print("[cyan]Creating Redis configuration...[/cyan]")
-        
-        self.render_template(
-            "redis.conf.j2",
-            UNBOUND_CONF_D / "redis.conf",
-            {}
-        )
-        
-        print_success("Redis configuration created")
+        self._create_static_config("redis")
     
     def create_root_hints_config(self) -> None:
         """Create root hints configuration."""
-        console.print("[cyan]Creating root hints configuration...[/cyan]")
-        
-        self.render_template(
-            "root-hints.conf.j2",
-            UNBOUND_CONF_D / "root-hints.conf",
-            {}
-        )
-        
-        print_success("Root hints configuration created")
+        self._create_static_config("root-hints")
     
     def create_full_configuration(self, server_ip: str) -> None:
         """Create all configuration files."""
         ensure_directory(UNBOUND_CONF_D)
         
-        self.create_main_config()
         self.create_server_config(server_ip)
-        self.create_control_config()
-        self.create_dnssec_config()
-        self.create_redis_config()
-        self.create_root_hints_config()
+        
+        # The remaining configs are independent; render them concurrently
+        # and report afterwards so the output stays in order
+        console.print("[cyan]Creating remaining configuration files...[/cyan]")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda spec: self.render_template(*spec[1:]), _STATIC_CONFIGS.values()))
+        for label, *_ in _STATIC_CONFIGS.values():
+            print_success(f"{label[:1].upper()}{label[1:]} created")
         
         print_success("Full configuration created")
     
     def validate_configuration(self) -> bool:
         """Validate Unbound configuration."""
-        from .utils import run_command
-        
         console.print("[cyan]Validating configuration...[/cyan]")
         
         try:
@@ -604,15 +817,14 @@ class ConfigManager:
         """View current configuration files."""
         console.print("[cyan]Current configuration files:[/cyan]\n")
         
-        for conf_file in UNBOUND_CONF_D.glob("*.conf"):
+        for conf_file in self._list_conf_files():
             console.print(f"[green]→[/green] {conf_file.name}")
             
-            with open(conf_file, 'r') as f:
-                # Show first 10 lines
-                lines = f.readlines()[:10]
-                for line in lines:
+            with open(conf_file, 'r', encoding='utf-8') as f:
+                # Show first 10 lines, reading no further than the 11th
+                for line in islice(f, 10):
                     console.print(f"  {line.rstrip()}")
-                if len(lines) == 10:
+                if f.readline():
                     console.print("  ...")
             console.print()
     
@@ -639,53 +851,29 @@ class ConfigManager:
         """Fix configuration file permissions."""
         console.print("[cyan]Fixing configuration permissions...[/cyan]")
         
-        # Fix main config
-        if UNBOUND_CONF.exists():
-            set_file_permissions(UNBOUND_CONF)
+        # Fix main config (skipped quietly if missing)
+        set_file_permissions(UNBOUND_CONF)
         
         # Fix all config files
-        for conf_file in UNBOUND_CONF_D.glob("*.conf"):
+        for conf_file in self._list_conf_files():
             set_file_permissions(conf_file)
         
-        # Fix keys
-        for key_file in UNBOUND_DIR.glob("*.key"):
-            set_file_permissions(key_file, mode=0o640)
-        
-        for pem_file in UNBOUND_DIR.glob("*.pem"):
-            set_file_permissions(pem_file, mode=0o640)
+        # Fix keys and certificates in one pass over the directory
+        for entry in _scan_files(UNBOUND_DIR):
+            if entry.name.endswith((".key", ".pem")):
+                set_file_permissions(Path(entry.path), mode=0o640)
         
         print_success("Permissions fixed")
 
     
     def select_dns_upstream(self) -> dict:
         """Interactive DNS upstream provider selection with standard navigation."""
-        from .constants import DNS_PROVIDERS, DNS_PROVIDER_ORDER
-        
         print_header("Select DNS Provider")
-        console.print("[dim]Encrypted (DoT) = Protected from eavesdropping[/dim]")
-        console.print("[dim]Unencrypted = Faster but visible to ISP[/dim]")
-        console.print()
-        
-        # Display options in a table
-        table = Table(show_header=True, header_style="bold magenta", box=None)
-        table.add_column("#", style="cyan", width=3)
-        table.add_column("Provider", width=25)
-        table.add_column("Security", width=12)
-        
-        for i, provider_key in enumerate(DNS_PROVIDER_ORDER, 1):
-            provider = DNS_PROVIDERS[provider_key]
-            security = "[green]Encrypted[/green]" if provider["encrypted"] else "[yellow]Unencrypted[/yellow]"
-            if provider_key == "none":
-                security = "[blue]Direct[/blue]"
-            table.add_row(str(i), provider["name"], security)
-        
-        console.print(table)
-        console.print()
+        console.file.write(_render_provider_table(console.width))
         print_nav_options()
         
         # Get selection
-        valid_choices = ["r", "q"] + [str(i) for i in range(1, len(DNS_PROVIDER_ORDER) + 1)]
-        choice = get_choice("Select provider", valid_choices)
+        choice = get_choice("Select provider", _PROVIDER_CHOICES)
         
         if choice == "q":
             return SubMenu.QUIT
@@ -743,6 +931,7 @@ class ConfigManager:
         if provider.get("key") == "none" or not provider.get("servers"):
             if forward_conf.exists():
                 forward_conf.unlink()
+                self._conf_files = None
                 print_success("Configured for full recursion (no forwarding)")
             else:
                 print_success("Using full recursion (no forwarding)")
@@ -750,7 +939,7 @@ class ConfigManager:
         
         # Build forwarding configuration
         is_encrypted = provider.get("encrypted", False)
-        servers = provider.get("servers", [])
+        servers = provider.get("servers", ())
         
         lines = [
             "# DNS Forwarding Configuration",
@@ -766,27 +955,18 @@ class ConfigManager:
         if is_encrypted:
             lines.append("    forward-tls-upstream: yes")
         
-        # Add servers
-        for server in servers:
-            ip = server.get("ip", "")
-            port = server.get("port", 853 if is_encrypted else 53)
-            hostname = server.get("hostname")
-            is_ipv6 = server.get("ipv6", False)
-            
-            # Skip IPv6 by default (can be enabled later)
-            if is_ipv6:
-                continue
-            
-            if is_encrypted and hostname:
-                lines.append(f"    forward-addr: {ip}@{port}#{hostname}")
-            else:
-                lines.append(f"    forward-addr: {ip}@{port}" if port != 53 else f"    forward-addr: {ip}")
+        # Add servers, skipping IPv6 by default (can be enabled later)
+        default_port = 853 if is_encrypted else 53
+        lines.extend(
+            _forward_addr_line(server, default_port, is_encrypted)
+            for server in servers if not server.get("ipv6", False)
+        )
         
         # Write configuration
         content = "\n".join(lines) + "\n"
         
-        with open(forward_conf, 'w') as f:
-            f.write(content)
+        atomic_write_text(forward_conf, content)
+        self._conf_files = None
         
         set_file_permissions(forward_conf)
         print_success(f"Forwarding configuration created: {forward_conf.name}")
@@ -800,29 +980,30 @@ class ConfigManager:
             border_style="cyan"
         ))
         
-        if not forward_conf.exists():
+        try:
+            f = open(forward_conf, 'r', encoding='utf-8')
+        except FileNotFoundError:
             console.print("[blue]Mode:[/blue] Full Recursion (no forwarding)")
             console.print("[dim]Unbound queries root servers directly[/dim]")
             return
         
-        with open(forward_conf, 'r') as f:
-            content = f.read()
-        
-        # Parse and display
-        is_encrypted = "forward-tls-upstream: yes" in content
+        # Parse everything in one pass over the file
+        is_encrypted = False
+        provider_name = None
+        servers = []
+        with f:
+            for line in f:
+                if 'forward-addr:' in line:
+                    servers.append(line.split('forward-addr:', 1)[1].strip())
+                elif provider_name is None and line.startswith('# Provider:'):
+                    provider_name = line[len('# Provider:'):].strip()
+                elif 'forward-tls-upstream: yes' in line:
+                    is_encrypted = True
         
         console.print(f"[blue]Mode:[/blue] {'Encrypted Forwarding (DoT)' if is_encrypted else 'Unencrypted Forwarding'}")
+        if provider_name is not None:
+            console.print(f"[blue]Provider:[/blue] {provider_name}")
         
-        # Extract provider name from comment
-        for line in content.split('\n'):
-            if line.startswith('# Provider:'):
-                provider_name = line.replace('# Provider:', '').strip()
-                console.print(f"[blue]Provider:[/blue] {provider_name}")
-                break
-        
-        # Extract servers
         console.print("[blue]Upstream Servers:[/blue]")
-        for line in content.split('\n'):
-            if 'forward-addr:' in line:
-                addr = line.split('forward-addr:')[1].strip()
-                console.print(f"  • {addr}")
+        for addr in servers:
+            console.print(f"  • {addr}")
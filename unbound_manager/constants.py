@@ -3,17 +3,34 @@
 import os
 from pathlib import Path
 
+# Package checkout and the user's source clone used by the updater
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+SOURCE_DIR = Path.home() / "unbound-manager"
+
 def get_app_version():
     """Get application version from VERSION file."""
     import glob
     
-    # Try multiple paths to find VERSION file
-    possible_paths = [
-        Path(__file__).parent.parent / "VERSION",  # Development
-        Path.home() / "unbound-manager" / "VERSION",  # User install
-    ]
+    # A checkout or the updater's clone carries the VERSION file
+    for version_path in (PROJECT_DIR / "VERSION", SOURCE_DIR / "VERSION"):
+        try:
+            return version_path.read_text().strip()
+        except OSError:
+            pass
+    
+    # An installed package knows its own version (Python 3.8+)
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        pass
+    else:
+        try:
+            return version("unbound-manager")
+        except PackageNotFoundError:
+            pass
     
     # Dynamically find Python site-packages directories
+    possible_paths = []
     for base_path in ["/usr/local/lib", "/usr/lib"]:
         python_dirs = glob.glob(f"{base_path}/python3.*")
         for python_dir in python_dirs:
@@ -32,11 +49,18 @@ def get_app_version():
 APP_VERSION = get_app_version()
 
 # Data directories
-DATA_DIR = Path(__file__).parent.parent / "data"
+DATA_DIR = PROJECT_DIR / "data"
 TEMPLATES_DIR = DATA_DIR / "templates"
 CONFIGS_DIR = DATA_DIR / "configs"
 SYSTEMD_DIR = DATA_DIR / "systemd"
 
+# Root-only cache (compiled Jinja2 templates, parsed config.yaml). Not under
+# $HOME: with sudo that can belong to the invoking user, and cached code and
+# data are loaded as root
+CACHE_DIR = Path("/var/cache/unbound-manager")
+JINJA_CACHE_DIR = CACHE_DIR / "jinja"
+CONFIG_CACHE = CACHE_DIR / "config.json"
+
 # Paths
 UNBOUND_DIR = Path("/etc/unbound")
 UNBOUND_CONF = UNBOUND_DIR / "unbound.conf"
@@ -45,6 +69,13 @@ BACKUP_DIR = UNBOUND_DIR / "backups"
 ROOT_KEY = UNBOUND_DIR / "root.key"
 ROOT_HINTS = UNBOUND_DIR / "root.hints"
 
+# Remote control (see control.conf.j2)
+CONTROL_HOST = "127.0.0.1"
+CONTROL_PORT = 8953
+CONTROL_SERVER_CERT = UNBOUND_DIR / "unbound_server.pem"
+CONTROL_KEY = UNBOUND_DIR / "unbound_control.key"
+CONTROL_CERT = UNBOUND_DIR / "unbound_control.pem"
+
 # Redis
 REDIS_SOCKET = Path("/var/run/redis/redis.sock")
 REDIS_CONF = Path("/etc/redis/redis.conf")
@@ -58,6 +89,7 @@ REDIS_SERVICE = "redis-server"
 
 # URLs
 UNBOUND_RELEASES_URL = "https://api.github.com/repos/NLnetLabs/unbound/releases"
+MANAGER_VERSION_URL = "https://raw.githubusercontent.com/regix1/unbound-manager/main/VERSION"
 ROOT_HINTS_URL = "https://www.internic.net/domain/named.cache"
 ROOT_HINTS_BACKUP_URL = "https://www.dns.icann.org/services/tools/internic/domain/named.cache"
 
@@ -90,123 +122,130 @@ COLORS = {
     "NC": "[/]",  # No color / reset
 }
 
+
 # Test domains
-TEST_DOMAINS = {
-    "basic": "google.com",
-    "dnssec": "iana.org",
-    "dnssec_fail": "dnssec-failed.org",
-    "ipv4": "example.com",
-    "ipv6": "google.com",
-    "mx": "gmail.com",
-    "txt": "google.com",
-}
+def _build_test_domains():
+    """Domains queried by the DNS tests, by test."""
+    return {
+        "basic": "google.com",
+        "dnssec": "iana.org",
+        "dnssec_fail": "dnssec-failed.org",
+        "ipv4": "example.com",
+        "ipv6": "google.com",
+        "mx": "gmail.com",
+        "txt": "google.com",
+    }
+
 
 # DNS Upstream Providers
 # Each provider has: name, description, servers (with DoT info), and whether it's encrypted
-DNS_PROVIDERS = {
-    "cloudflare": {
-        "name": "Cloudflare",
-        "description": "Fastest public DNS, privacy-focused, KPMG audited",
-        "encrypted": True,
-        "servers": [
-            {"ip": "1.1.1.1", "port": 853, "hostname": "cloudflare-dns.com"},
-            {"ip": "1.0.0.1", "port": 853, "hostname": "cloudflare-dns.com"},
-            {"ip": "2606:4700:4700::1111", "port": 853, "hostname": "cloudflare-dns.com", "ipv6": True},
-            {"ip": "2606:4700:4700::1001", "port": 853, "hostname": "cloudflare-dns.com", "ipv6": True},
-        ],
-    },
-    "cloudflare_malware": {
-        "name": "Cloudflare (Malware Blocking)",
-        "description": "Cloudflare with malware filtering enabled",
-        "encrypted": True,
-        "servers": [
-            {"ip": "1.1.1.2", "port": 853, "hostname": "security.cloudflare-dns.com"},
-            {"ip": "1.0.0.2", "port": 853, "hostname": "security.cloudflare-dns.com"},
-        ],
-    },
-    "cloudflare_family": {
-        "name": "Cloudflare (Family Safe)",
-        "description": "Cloudflare with malware + adult content filtering",
-        "encrypted": True,
-        "servers": [
-            {"ip": "1.1.1.3", "port": 853, "hostname": "family.cloudflare-dns.com"},
-            {"ip": "1.0.0.3", "port": 853, "hostname": "family.cloudflare-dns.com"},
-        ],
-    },
-    "quad9": {
-        "name": "Quad9",
-        "description": "Swiss non-profit, maximum privacy, malware blocking",
-        "encrypted": True,
-        "servers": [
-            {"ip": "9.9.9.9", "port": 853, "hostname": "dns.quad9.net"},
-            {"ip": "149.112.112.112", "port": 853, "hostname": "dns.quad9.net"},
-            {"ip": "2620:fe::fe", "port": 853, "hostname": "dns.quad9.net", "ipv6": True},
-            {"ip": "2620:fe::9", "port": 853, "hostname": "dns.quad9.net", "ipv6": True},
-        ],
-    },
-    "quad9_unsecured": {
-        "name": "Quad9 (No Filtering)",
-        "description": "Quad9 without malware blocking",
-        "encrypted": True,
-        "servers": [
-            {"ip": "9.9.9.10", "port": 853, "hostname": "dns10.quad9.net"},
-            {"ip": "149.112.112.10", "port": 853, "hostname": "dns10.quad9.net"},
-        ],
-    },
-    "google": {
-        "name": "Google DNS",
-        "description": "Fast and reliable, DNSSEC support",
-        "encrypted": True,
-        "servers": [
-            {"ip": "8.8.8.8", "port": 853, "hostname": "dns.google"},
-            {"ip": "8.8.4.4", "port": 853, "hostname": "dns.google"},
-            {"ip": "2001:4860:4860::8888", "port": 853, "hostname": "dns.google", "ipv6": True},
-            {"ip": "2001:4860:4860::8844", "port": 853, "hostname": "dns.google", "ipv6": True},
-        ],
-    },
-    "opendns": {
-        "name": "OpenDNS (Cisco)",
-        "description": "Reliable with phishing protection",
-        "encrypted": True,
-        "servers": [
-            {"ip": "208.67.222.222", "port": 853, "hostname": "dns.opendns.com"},
-            {"ip": "208.67.220.220", "port": 853, "hostname": "dns.opendns.com"},
-        ],
-    },
-    "adguard": {
-        "name": "AdGuard DNS",
-        "description": "Ad and tracker blocking built-in",
-        "encrypted": True,
-        "servers": [
-            {"ip": "94.140.14.14", "port": 853, "hostname": "dns.adguard-dns.com"},
-            {"ip": "94.140.15.15", "port": 853, "hostname": "dns.adguard-dns.com"},
-        ],
-    },
-    "adguard_family": {
-        "name": "AdGuard DNS (Family)",
-        "description": "AdGuard with adult content filtering",
-        "encrypted": True,
-        "servers": [
-            {"ip": "94.140.14.15", "port": 853, "hostname": "family.adguard-dns.com"},
-            {"ip": "94.140.15.16", "port": 853, "hostname": "family.adguard-dns.com"},
-        ],
-    },
-    "none": {
-        "name": "Full Recursion (No Forwarding)",
-        "description": "Query root servers directly - most private, slower",
-        "encrypted": False,
-        "servers": [],
-    },
-    "custom_unencrypted": {
-        "name": "Custom Unencrypted DNS",
-        "description": "Use your own DNS servers (unencrypted)",
-        "encrypted": False,
-        "servers": [],
-    },
-}
+def _build_dns_providers():
+    """Forwarding presets by key; see DNS_PROVIDER_ORDER for menu order."""
+    return {
+        "cloudflare": {
+            "name": "Cloudflare",
+            "description": "Fastest public DNS, privacy-focused, KPMG audited",
+            "encrypted": True,
+            "servers": (
+                {"ip": "1.1.1.1", "port": 853, "hostname": "cloudflare-dns.com"},
+                {"ip": "1.0.0.1", "port": 853, "hostname": "cloudflare-dns.com"},
+                {"ip": "2606:4700:4700::1111", "port": 853, "hostname": "cloudflare-dns.com", "ipv6": True},
+                {"ip": "2606:4700:4700::1001", "port": 853, "hostname": "cloudflare-dns.com", "ipv6": True},
+            ),
+        },
+        "cloudflare_malware": {
+            "name": "Cloudflare (Malware Blocking)",
+            "description": "Cloudflare with malware filtering enabled",
+            "encrypted": True,
+            "servers": (
+                {"ip": "1.1.1.2", "port": 853, "hostname": "security.cloudflare-dns.com"},
+                {"ip": "1.0.0.2", "port": 853, "hostname": "security.cloudflare-dns.com"},
+            ),
+        },
+        "cloudflare_family": {
+            "name": "Cloudflare (Family Safe)",
+            "description": "Cloudflare with malware + adult content filtering",
+            "encrypted": True,
+            "servers": (
+                {"ip": "1.1.1.3", "port": 853, "hostname": "family.cloudflare-dns.com"},
+                {"ip": "1.0.0.3", "port": 853, "hostname": "family.cloudflare-dns.com"},
+            ),
+        },
+        "quad9": {
+            "name": "Quad9",
+            "description": "Swiss non-profit, maximum privacy, malware blocking",
+            "encrypted": True,
+            "servers": (
+                {"ip": "9.9.9.9", "port": 853, "hostname": "dns.quad9.net"},
+                {"ip": "149.112.112.112", "port": 853, "hostname": "dns.quad9.net"},
+                {"ip": "2620:fe::fe", "port": 853, "hostname": "dns.quad9.net", "ipv6": True},
+                {"ip": "2620:fe::9", "port": 853, "hostname": "dns.quad9.net", "ipv6": True},
+            ),
+        },
+        "quad9_unsecured": {
+            "name": "Quad9 (No Filtering)",
+            "description": "Quad9 without malware blocking",
+            "encrypted": True,
+            "servers": (
+                {"ip": "9.9.9.10", "port": 853, "hostname": "dns10.quad9.net"},
+                {"ip": "149.112.112.10", "port": 853, "hostname": "dns10.quad9.net"},
+            ),
+        },
+        "google": {
+            "name": "Google DNS",
+            "description": "Fast and reliable, DNSSEC support",
+            "encrypted": True,
+            "servers": (
+                {"ip": "8.8.8.8", "port": 853, "hostname": "dns.google"},
+                {"ip": "8.8.4.4", "port": 853, "hostname": "dns.google"},
+                {"ip": "2001:4860:4860::8888", "port": 853, "hostname": "dns.google", "ipv6": True},
+                {"ip": "2001:4860:4860::8844", "port": 853, "hostname": "dns.google", "ipv6": True},
+            ),
+        },
+        "opendns": {
+            "name": "OpenDNS (Cisco)",
+            "description": "Reliable with phishing protection",
+            "encrypted": True,
+            "servers": (
+                {"ip": "208.67.222.222", "port": 853, "hostname": "dns.opendns.com"},
+                {"ip": "208.67.220.220", "port": 853, "hostname": "dns.opendns.com"},
+            ),
+        },
+        "adguard": {
+            "name": "AdGuard DNS",
+            "description": "Ad and tracker blocking built-in",
+            "encrypted": True,
+            "servers": (
+                {"ip": "94.140.14.14", "port": 853, "hostname": "dns.adguard-dns.com"},
+                {"ip": "94.140.15.15", "port": 853, "hostname": "dns.adguard-dns.com"},
+            ),
+        },
+        "adguard_family": {
+            "name": "AdGuard DNS (Family)",
+            "description": "AdGuard with adult content filtering",
+            "encrypted": True,
+            "servers": (
+                {"ip": "94.140.14.15", "port": 853, "hostname": "family.adguard-dns.com"},
+                {"ip": "94.140.15.16", "port": 853, "hostname": "family.adguard-dns.com"},
+            ),
+        },
+        "none": {
+            "name": "Full Recursion (No Forwarding)",
+            "description": "Query root servers directly - most private, slower",
+            "encrypted": False,
+            "servers": (),
+        },
+        "custom_unencrypted": {
+            "name": "Custom Unencrypted DNS",
+            "description": "Use your own DNS servers (unencrypted)",
+            "encrypted": False,
+            "servers": (),
+        },
+    }
+
 
 # Recommended providers shown first in selection menu
-DNS_PROVIDER_ORDER = [
+DNS_PROVIDER_ORDER = (
     "none",
     "quad9",
     "cloudflare",
@@ -218,4 +257,22 @@ DNS_PROVIDER_ORDER = [
     "quad9_unsecured",
     "opendns",
     "custom_unencrypted",
-]
\ No newline at end of file
+)
+
+
+# The tables above are only built when first imported or accessed (PEP 562),
+# so modules that just need paths don't pay for them
+_LAZY_CONSTANTS = {
+    "TEST_DOMAINS": _build_test_domains,
+    "DNS_PROVIDERS": _build_dns_providers,
+}
+
+
+def __getattr__(name):
+    """Build a lazy table on first access and keep it as a module global."""
+    try:
+        builder = _LAZY_CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = builder()
+    return value
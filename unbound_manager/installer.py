@@ -43,12 +43,13 @@ class UnboundInstaller:
     def get_available_versions(self) -> List[str]:
         """Fetch available Unbound versions from GitHub."""
         try:
-            response = requests.get(UNBOUND_RELEASES_URL, timeout=10)
+            # Ask GitHub for the last 5 releases only instead of slicing a full page
+            response = requests.get(UNBOUND_RELEASES_URL, params={"per_page": 5}, timeout=10)
             response.raise_for_status()
             releases = response.json()
             
             versions = []
-            for release in releases[:5]:  # Get last 5 releases
+            for release in releases:
                 tag = release.get('tag_name', '')
                 if tag.startswith('release-'):
                     version = tag.replace('release-', '')
@@ -623,8 +624,8 @@ class UnboundInstaller:
         # Restart services
         console.print("[cyan]Restarting services...[/cyan]")
         run_command(["systemctl", "daemon-reload"])
-        run_command(["systemctl", "restart", REDIS_SERVICE])
-        run_command(["systemctl", "restart", UNBOUND_SERVICE])
+        # One systemctl call queues both restarts as a single transaction
+        run_command(["systemctl", "restart", REDIS_SERVICE, UNBOUND_SERVICE])
         
         print_success("Installation fixes applied")
         
@@ -7,7 +7,9 @@ import termios
 import tty
 from typing import List, Optional, Callable, Any
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from rich.console import Console
+from rich.control import Control
 from rich.panel import Panel
 from rich.text import Text
 from rich.prompt import Prompt
@@ -15,6 +17,34 @@ from rich.prompt import Prompt
 from .ui import print_header, print_nav_options, pause, get_choice, console
 
 
+@lru_cache(maxsize=256)
+def _markup(line: str) -> Text:
+    """Parse a menu line's markup once; item lines repeat on every redraw."""
+    return Text.from_markup(line)
+
+
+# Single-key shortcuts accepted by InteractiveMenu.run
+_LETTER_KEYS = frozenset("stlcdma")
+_NUMBER_KEYS = frozenset("123456789")
+
+# ANSI "erase to end of line", used when patching changed menu rows
+_ERASE_LINE = "\x1b[K"
+
+# Static header of the interactive menu, parsed once
+_MENU_HEADER = Text.from_markup(
+    "╔" + "═" * 78 + "╗\n"
+    "║ [bold cyan]UNBOUND DNS MANAGER[/bold cyan] - Interactive Menu" + " " * 35 + "║\n"
+    "╠" + "═" * 78 + "╣\n"
+    "║ [dim]↑↓ Navigate │ Enter: Select │ ESC: Back │ h: Help │ q: Exit[/dim]" + " " * 15 + "║\n"
+    "╚" + "═" * 78 + "╝\n"
+)
+
+# Key help shown instead of _MENU_HEADER when the caller supplies its own header
+_MENU_KEYS = Text.from_markup(
+    " [dim]↑↓ Navigate │ Enter: Select │ ESC: Back │ h: Help │ q: Exit[/dim]\n"
+)
+
+
 @dataclass
 class MenuItem:
     """Represents a single menu item."""
@@ -24,6 +54,8 @@ class MenuItem:
     description: str = ""
     key: Optional[str] = None
     style: str = "cyan"
+    # Set False for actions that draw their own header (or print nothing)
+    clear_screen: bool = True
 
 
 @dataclass
@@ -33,6 +65,8 @@ class MenuCategory:
     items: List[MenuItem] = None
     prefix: str = ""
     expanded: bool = False
+    # Called each time the category is opened, e.g. to start a slow lookup
+    on_expand: Optional[Callable[[], None]] = None
     
     def __post_init__(self):
         if self.items is None:
@@ -52,6 +86,27 @@ class InteractiveMenu:
         self.current_index = 0
         self.in_category = False
         self.category_index = 0
+        # (content hash, width) and lines of the frame currently on screen
+        self._last_frame: Optional[tuple] = None
+        self._screen_lines: List[str] = []
+        # Optional pre-rendered text drawn above the menu in place of its own
+        # title box; set by the caller between run() calls
+        self.header: Optional[str] = None
+        # Set when a selected action has run, see run()
+        self._acted = False
+        # (expansion state, key -> index, number -> index), see _shortcut_index
+        self._shortcuts: Optional[tuple] = None
+        
+        # Fixed key bindings; letter and number shortcuts are handled in run()
+        show_help = partial(self.quick_select_by_key, 'h')
+        self._key_handlers = {
+            'UP': self.navigate_up, 'k': self.navigate_up,
+            'DOWN': self.navigate_down, 'j': self.navigate_down,
+            'ENTER': self.handle_selection, ' ': self.handle_selection,
+            'ESC': self.go_back, 'b': self.go_back,
+            'q': lambda: False, 'Q': lambda: False,
+            'h': show_help, 'H': show_help, '?': show_help,
+        }
     
     def add_item(self, item: MenuItem) -> None:
         """Add a top-level menu item."""
@@ -92,16 +147,50 @@ class InteractiveMenu:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     
     def display_menu(self) -> None:
-        """Display the current menu state."""
-        console.clear()
+        """Display the current menu state, skipping redraws of an unchanged frame."""
+        with console.capture() as capture:
+            self._render_menu()
+        frame = capture.get()
+        if self.header is not None:
+            frame = self.header + frame
+        
+        frame_key = (hash(frame), console.width)
+        if frame_key == self._last_frame:
+            return
+        
+        lines = frame.splitlines()
+        previous = self._screen_lines
+        if (
+            self._last_frame is None
+            or self._last_frame[1] != frame_key[1]
+            or max(len(lines), len(previous)) >= console.height
+        ):
+            # Nothing reliable on screen to diff against: full redraw
+            console.clear()
+            console.file.write(frame)
+        else:
+            # Rewrite only the rows that changed, then blank any leftover rows
+            output = []
+            for row in range(max(len(lines), len(previous))):
+                line = lines[row] if row < len(lines) else ""
+                if row < len(previous) and previous[row] == line:
+                    continue
+                output.append(Control.move_to(0, row).segment.text + line + _ERASE_LINE)
+            output.append(Control.move_to(0, len(lines)).segment.text)
+            console.file.write("".join(output))
+        console.file.flush()
         
+        self._last_frame = frame_key
+        self._screen_lines = lines
+    
+    def invalidate(self) -> None:
+        """Force the next display_menu call to redraw the whole screen."""
+        self._last_frame = None
+    
+    def _render_menu(self) -> None:
+        """Print the menu frame to the console."""
         # Header
-        console.print("╔" + "═" * 78 + "╗")
-        console.print("║ [bold cyan]UNBOUND DNS MANAGER[/bold cyan] - Interactive Menu" + " " * 35 + "║")
-        console.print("╠" + "═" * 78 + "╣")
-        console.print("║ [dim]↑↓ Navigate │ Enter: Select │ ESC: Back │ h: Help │ q: Exit[/dim]" + " " * 15 + "║")
-        console.print("╚" + "═" * 78 + "╝")
-        console.print()
+        console.print(_MENU_HEADER if self.header is None else _MENU_KEYS)
         
         # Display items
         visible_items = self._get_visible_items()
@@ -113,10 +202,12 @@ class InteractiveMenu:
                 # Category display
                 if is_selected:
                     arrow = "▼" if item.expanded else "►"
-                    console.print(f"  [bold yellow on blue] {arrow} {item.prefix} {item.name:<50}[/bold yellow on blue]")
+                    console.print(_markup(
+                        f"  [bold yellow on blue] {arrow} {item.prefix} {item.name:<50}[/bold yellow on blue]"
+                    ))
                 else:
                     arrow = "▼" if item.expanded else "►"
-                    console.print(f"  [bold cyan]{arrow} {item.prefix} {item.name}[/bold cyan]")
+                    console.print(_markup(f"  [bold cyan]{arrow} {item.prefix} {item.name}[/bold cyan]"))
                     
             elif isinstance(item, MenuItem):
                 # Item display
@@ -130,16 +221,16 @@ class InteractiveMenu:
                     
                     # Show with selection highlight
                     if item.style == "red":
-                        console.print(f"{indent}[bold white on red] → {display_text:<52}[/bold white on red]")
+                        console.print(_markup(f"{indent}[bold white on red] → {display_text:<52}[/bold white on red]"))
                     else:
-                        console.print(f"{indent}[bold white on blue] → {display_text:<52}[/bold white on blue]")
+                        console.print(_markup(f"{indent}[bold white on blue] → {display_text:<52}[/bold white on blue]"))
                     
                     # Show description below if available
                     if item.description:
-                        console.print(f"{indent}   [dim]{item.description}[/dim]")
+                        console.print(_markup(f"{indent}   [dim]{item.description}[/dim]"))
                 else:
                     display_text = f"{item.prefix} {item.name}" if item.prefix else item.name
-                    console.print(f"{indent}[{item.style}]  {display_text}[/{item.style}]")
+                    console.print(_markup(f"{indent}[{item.style}]  {display_text}[/{item.style}]"))
         
         # Footer with current item info
         console.print()
@@ -181,10 +272,15 @@ class InteractiveMenu:
         if isinstance(current_item, MenuCategory):
             # Toggle category expansion
             current_item.expanded = not current_item.expanded
+            if current_item.expanded and current_item.on_expand is not None:
+                current_item.on_expand()
             return None
         elif isinstance(current_item, MenuItem):
-            # Execute action
-            console.clear()
+            # Execute action; it draws over the menu, so redraw afterwards
+            self.invalidate()
+            self._acted = True
+            if current_item.clear_screen:
+                console.clear()
             try:
                 result = current_item.action()
                 return result
@@ -208,92 +304,88 @@ class InteractiveMenu:
         if self.current_index < len(visible_items) - 1:
             self.current_index += 1
     
+    def go_back(self) -> None:
+        """Collapse all categories and return to the top."""
+        self.collapse_all()
+        self.current_index = 0
+    
     def collapse_all(self) -> None:
         """Collapse all categories."""
         for item in self.items:
             if isinstance(item, MenuCategory):
                 item.expanded = False
     
+    def _shortcut_index(self) -> tuple:
+        """Map shortcut keys and numbers to visible positions.
+        
+        Rebuilt only when the set of items or their expansion changes.
+        """
+        state = (len(self.items),) + tuple(
+            item.expanded for item in self.items if isinstance(item, MenuCategory)
+        )
+        if self._shortcuts is None or self._shortcuts[0] != state:
+            by_key, by_number = {}, {}
+            for idx, (item, _, _) in enumerate(self._get_visible_items()):
+                # Numbers count MenuItems only, not categories
+                if isinstance(item, MenuItem):
+                    by_number[len(by_number) + 1] = idx
+                    if item.key:
+                        by_key.setdefault(item.key, idx)
+            self._shortcuts = (state, by_key, by_number)
+        return self._shortcuts[1:]
+    
+    def _select_index(self, idx: Optional[int]) -> Any:
+        """Move to a visible position and run it, if the position exists."""
+        if idx is None:
+            return None
+        self.current_index = idx
+        return self.handle_selection()
+    
     def quick_select_by_key(self, key: str) -> Any:
         """Quick select an item by its shortcut key."""
-        visible_items = self._get_visible_items()
-        
-        for idx, (item, _, _) in enumerate(visible_items):
-            if isinstance(item, MenuItem) and item.key == key.lower():
-                self.current_index = idx
-                return self.handle_selection()
-        
-        return None
+        by_key, _ = self._shortcut_index()
+        return self._select_index(by_key.get(key.lower()))
     
     def quick_select_by_number(self, number: int) -> Any:
         """Quick select an item by number."""
-        visible_items = self._get_visible_items()
-        
-        # Get numbered items (MenuItems only, not categories)
-        numbered_items = []
-        item_count = 0
-        
-        for idx, (item, _, parent_idx) in enumerate(visible_items):
-            if isinstance(item, MenuItem):
-                item_count += 1
-                numbered_items.append((item_count, idx))
-        
-        # Find and select the item
-        for num, idx in numbered_items:
-            if num == number:
-                self.current_index = idx
-                return self.handle_selection()
-        
-        return None
+        _, by_number = self._shortcut_index()
+        return self._select_index(by_number.get(number))
     
     def run(self) -> Any:
-        """Run the interactive menu loop."""
+        """Run the interactive menu loop.
+        
+        Returns False to quit, or None after an action has run so the caller
+        can refresh anything it shows (such as header) before running it again.
+        """
+        self._acted = False
         while True:
             self.display_menu()
             
             try:
                 key = self.get_key()
                 
-                # Navigation
-                if key == 'UP' or key == 'k':
-                    self.navigate_up()
-                elif key == 'DOWN' or key == 'j':
-                    self.navigate_down()
-                elif key == 'ENTER' or key == ' ':
-                    result = self.handle_selection()
-                    if result is False:
-                        return False
-                elif key == 'ESC' or key == 'b':
-                    # Go back: collapse categories and return to top
-                    self.collapse_all()
-                    self.current_index = 0
-                
-                # Quick keys
-                elif key == 'q' or key == 'Q':
-                    return False
-                elif key == 'h' or key == 'H' or key == '?':
-                    # Find and execute help
-                    result = self.quick_select_by_key('h')
-                    if result is False:
-                        return False
-                
+                handler = self._key_handlers.get(key)
+                if handler is not None:
+                    result = handler()
                 # Letter shortcuts
-                elif key.lower() in 'stlcdma':
+                elif key.lower() in _LETTER_KEYS:
                     result = self.quick_select_by_key(key.lower())
-                    if result is False:
-                        return False
-                
                 # Number selection
-                elif key.isdigit() and key != '0':
-                    num = int(key)
-                    result = self.quick_select_by_number(num)
-                    if result is False:
-                        return False
+                elif key in _NUMBER_KEYS:
+                    result = self.quick_select_by_number(int(key))
+                else:
+                    result = None
+                
+                if result is False:
+                    return False
+                if self._acted:
+                    return None
                     
             except KeyboardInterrupt:
                 # Handle Ctrl+C gracefully
                 console.print("\n\n[yellow]Use 'q' to quit or ESC to go back[/yellow]")
                 pause()
+                self.invalidate()
 
 
 class SimpleMenu:
@@ -326,7 +418,6 @@ class SimpleMenu:
         self.display()
         
         choices = ["0"] + [str(i) for i in range(1, len(self.items) + 1)]
-        from rich.prompt import Prompt
         choice = Prompt.ask("Select option", choices=choices, default="0")
         
         if choice == "0":
@@ -410,16 +501,20 @@ class SubMenu:
             - Result of action callable
             - None if action has no return
         """
+        # Valid choices and shortcut keys don't change while the menu is open
+        valid = ["r", "q"] + [str(i) for i in range(1, len(self.options) + 1)]
+        shortcuts = {}
+        for i, (_, _, key) in enumerate(self.options, 1):
+            if key:
+                valid.append(key.lower())
+                shortcuts.setdefault(key.lower(), str(i))
+        
+        # Only redraw after an action has drawn over the menu
+        redraw = True
         while True:
-            self.display()
-            
-            # Build valid choices
-            valid = ["r", "q"] + [str(i) for i in range(1, len(self.options) + 1)]
-            
-            # Add shortcut keys
-            for _, _, key in self.options:
-                if key:
-                    valid.append(key.lower())
+            if redraw:
+                self.display()
+                redraw = False
             
             choice = get_choice("Select", valid)
             
@@ -430,10 +525,7 @@ class SubMenu:
                 return SubMenu.RETURN
             
             # Handle shortcut keys
-            for i, (label, action, key) in enumerate(self.options):
-                if key and choice.lower() == key.lower():
-                    choice = str(i + 1)
-                    break
+            choice = shortcuts.get(choice.lower(), choice)
             
             # Handle numbered selection
             if choice.isdigit():
@@ -441,6 +533,7 @@ class SubMenu:
                 if 0 <= idx < len(self.options):
                     label, action, _ = self.options[idx]
                     if action:
+                        redraw = True
                         console.clear()
                         try:
                             result = action()
@@ -1,9 +1,17 @@
 """Shared UI components for consistent display across the application."""
 
+import os
+import sys
+import termios
+import tty
+from typing import Sequence
+
 from rich.console import Console
 from rich.prompt import Prompt
 
-console = Console()
+# Shared console for the whole application. Automatic highlighting and emoji
+# codes are disabled since every message is styled explicitly with markup.
+console = Console(highlight=False, emoji=False)
 
 # Box drawing constants
 BOX_WIDTH = 58
@@ -20,10 +28,12 @@ def print_header(title: str, clear: bool = True) -> None:
         console.clear()
     
     title_centered = title.upper().center(BOX_WIDTH - 4)
-    console.print("┌" + "─" * BOX_WIDTH + "┐")
-    console.print(f"│  [bold cyan]{title_centered}[/bold cyan]  │")
-    console.print("└" + "─" * BOX_WIDTH + "┘")
-    console.print()
+    console.print(
+        "┌" + "─" * BOX_WIDTH + "┐\n"
+        f"│  [bold cyan]{title_centered}[/bold cyan]  │\n"
+        "└" + "─" * BOX_WIDTH + "┘\n",
+        highlight=False,
+    )
 
 
 def print_separator() -> None:
@@ -40,17 +50,33 @@ def print_nav_options() -> None:
 
 
 def pause() -> None:
-    """Pause and wait for Enter key."""
-    console.print("\n[dim]Press Enter to continue...[/dim]")
-    input()
-
-
-def get_choice(prompt_text: str, valid_choices: list, default: str = "r") -> str:
+    """Pause until a key is pressed (Enter when stdin is not a terminal)."""
+    if not sys.stdin.isatty():
+        console.input("\n[dim]Press Enter to continue...[/dim]")
+        return
+    
+    console.print("\n[dim]Press any key to continue...[/dim]", end="")
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        # cbreak keeps Ctrl+C working, unlike the raw mode used by the menu
+        tty.setcbreak(fd)
+        # Read the descriptor directly so nothing lands in sys.stdin's buffer,
+        # then drop the rest of a multi-byte key (e.g. "[A" after an arrow's
+        # ESC) so it can't select something in the next prompt
+        os.read(fd, 32)
+        termios.tcflush(fd, termios.TCIFLUSH)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        console.print()
+
+
+def get_choice(prompt_text: str, valid_choices: Sequence[str], default: str = "r") -> str:
     """Get user choice with standard formatting.
     
     Args:
         prompt_text: Text to show in prompt
-        valid_choices: List of valid choice strings
+        valid_choices: Sequence of valid choice strings
         default: Default choice (default "r" for return)
     
     Returns:
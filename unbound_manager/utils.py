@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 import os
+import re
+import shutil
+import stat
 import sys
 import subprocess
+import tempfile
 import socket
+import ssl
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Callable
 import psutil
-from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-console = Console()
+from .constants import CONTROL_HOST, CONTROL_PORT, CONTROL_SERVER_CERT, CONTROL_KEY, CONTROL_CERT
+from .ui import console
 
 
 def check_root() -> None:
@@ -24,6 +30,31 @@ def check_root() -> None:
         sys.exit(1)
 
 
+# Tools that never move during a session; their PATH lookup is done once
+_CACHED_BINARIES = frozenset(("systemctl", "git", "pip3"))
+
+# Process umask, read once at import while still single-threaded
+# (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# First IPv4 address in `ip -4 addr show` output
+_INET4_RE = re.compile(r'inet\s+(\d+\.\d+\.\d+\.\d+)')
+
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> str:
+    """Absolute path of a binary, or the bare name if it is not on PATH."""
+    return shutil.which(name) or name
+
+
+def _resolve(command: List[str]) -> List[str]:
+    """Swap a cached absolute path in for well-known binaries."""
+    if command and command[0] in _CACHED_BINARIES:
+        return [_which(command[0])] + command[1:]
+    return command
+
+
 def run_command(
     command: List[str],
     check: bool = True,
@@ -48,7 +79,7 @@ def run_command(
     """
     try:
         result = subprocess.run(
-            command,
+            _resolve(command),
             check=check,
             capture_output=capture_output,
             text=text,
@@ -70,8 +101,98 @@ def run_command(
         raise
 
 
+def stream_command(
+    command: List[str],
+    on_line: Callable[[str], None],
+    check: bool = True,
+    cwd: Optional[Path] = None,
+) -> int:
+    """
+    Run a command, passing each line of its combined output to a callback.
+    
+    Args:
+        command: Command to run as list of strings
+        on_line: Called with each output line, trailing whitespace stripped
+        check: Whether to raise exception on non-zero exit
+        cwd: Working directory for the command
+    
+    Returns:
+        The command's exit code
+    """
+    try:
+        process = subprocess.Popen(
+            _resolve(command),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            cwd=cwd,
+        )
+    except FileNotFoundError:
+        console.print(f"[red]Command not found: {command[0]}[/red]")
+        raise
+    
+    with process:
+        for line in process.stdout:
+            line = line.rstrip()
+            if line:
+                on_line(line)
+    
+    if check and process.returncode != 0:
+        console.print(f"[red]Command failed: {' '.join(command)}[/red]")
+        raise subprocess.CalledProcessError(process.returncode, command)
+    return process.returncode
+
+
+@lru_cache(maxsize=1)
+def _sd_bus() -> Optional[Tuple[Any, Any]]:
+    """Get a cached system D-Bus connection and systemd manager proxy, or None if unavailable.
+    
+    Proxies are created with introspect=False: every call names its interface,
+    and systemd's introspection XML is large enough to cost a round trip.
+    """
+    try:
+        import dbus
+        bus = dbus.SystemBus()
+        manager = bus.get_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1", introspect=False)
+        return bus, manager
+    except Exception:
+        return None
+
+
+def unit_active_state(service: str) -> Optional[str]:
+    """
+    Get the ActiveState of a systemd unit over D-Bus.
+    
+    Returns:
+        The state string (e.g. "active", "inactive"), or None if D-Bus
+        is not available and the caller should fall back to systemctl.
+    """
+    connection = _sd_bus()
+    if connection is None:
+        return None
+    bus, manager = connection
+    
+    unit_name = service if "." in service else f"{service}.service"
+    try:
+        unit_path = manager.LoadUnit(unit_name, dbus_interface="org.freedesktop.systemd1.Manager")
+        unit = bus.get_object("org.freedesktop.systemd1", unit_path, introspect=False)
+        return str(unit.Get(
+            "org.freedesktop.systemd1.Unit",
+            "ActiveState",
+            dbus_interface="org.freedesktop.DBus.Properties",
+        ))
+    except Exception:
+        return None
+
+
 def check_service_status(service: str) -> bool:
     """Check if a systemd service is running."""
+    # Prefer a D-Bus property read over forking systemctl
+    state = unit_active_state(service)
+    if state is not None:
+        return state in ("active", "reloading")
+    
     try:
         result = run_command(
             ["systemctl", "is-active", "--quiet", service],
@@ -102,10 +223,9 @@ def get_server_ip() -> str:
             check=False,
         )
         if result.returncode == 0 and result.stdout:
-            import re
-            matches = re.findall(r'inet\s+(\d+\.\d+\.\d+\.\d+)', result.stdout)
-            if matches:
-                return matches[0]
+            match = _INET4_RE.search(result.stdout)
+            if match:
+                return match.group(1)
     except Exception:
         pass
     
@@ -162,18 +282,87 @@ def ensure_user_exists(username: str = "unbound", home: str = "/var/lib/unbound"
         ])
 
 
+def is_private(st: os.stat_result) -> bool:
+    """Whether a stat result is owned by us and not writable by group or others."""
+    return st.st_uid == os.geteuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def private_cache_dir(path: Path) -> bool:
+    """Create a 0700 cache directory and check it is safe to load cached code or data from.
+    
+    Returns False (callers then skip caching) if it can't be created, is a
+    symlink or not is_private, or its parent is writable by anyone but us
+    or root.
+    """
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(path)
+        parent = os.stat(path.parent)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode) and is_private(st)
+        and parent.st_uid in (0, os.geteuid()) and not parent.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write a file via a temporary sibling and rename it into place.
+    
+    Readers (and a crash mid-write) only ever see the old or the new content.
+    A symlink is written through to its target. An existing file keeps its
+    mode and owner; a new one gets 0666 less the umask, as open() would.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    
+    data = memoryview(text.encode('utf-8'))
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        try:
+            if st is None:
+                os.fchmod(fd, 0o666 & ~_UMASK)
+            else:
+                os.fchmod(fd, stat.S_IMODE(st.st_mode))
+                if (st.st_uid, st.st_gid) != (os.geteuid(), os.getegid()):
+                    try:
+                        os.fchown(fd, st.st_uid, st.st_gid)
+                    except PermissionError:
+                        pass  # Only root can give a file away; keep ours
+            # One write on the raw descriptor; no text wrapper or buffer to flush
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=None)
+def _lookup_ids(owner: str, group: str) -> Tuple[int, int]:
+    """Resolve a user and group name to (uid, gid); raises KeyError if unknown."""
+    import pwd
+    import grp
+    return pwd.getpwnam(owner).pw_uid, grp.getgrnam(group).gr_gid
+
+
 def set_file_permissions(path: Path, owner: str = "unbound", group: str = "unbound", mode: int = 0o644) -> None:
     """Set file ownership and permissions."""
-    if not path.exists():
-        return
-    
     try:
-        import pwd
-        import grp
-        uid = pwd.getpwnam(owner).pw_uid
-        gid = grp.getgrnam(group).gr_gid
+        uid, gid = _lookup_ids(owner, group)
         os.chown(path, uid, gid)
-        path.chmod(mode)
+        os.chmod(path, mode)
+    except FileNotFoundError:
+        return
     except (KeyError, OSError) as e:
         console.print(f"[yellow]Warning: Could not set permissions for {path}: {e}[/yellow]")
 
@@ -240,16 +429,92 @@ def format_bytes(bytes_value: int) -> str:
     return f"{bytes_value:.2f} PB"
 
 
-def parse_unbound_stats(raw: str) -> Dict[str, str]:
-    """Parse unbound-control stats output into a dictionary."""
+def parse_unbound_stats(raw: str, keys: Optional[Tuple[str, ...]] = None) -> Dict[str, str]:
+    """
+    Parse unbound-control stats output into a dictionary.
+    
+    Args:
+        raw: Output of unbound-control stats
+        keys: If given, only collect these keys and stop once all are found
+    
+    Returns:
+        Dictionary of stat name to value
+    """
     stats: Dict[str, str] = {}
     for line in raw.splitlines():
-        if "=" in line:
-            key, value = line.split("=", 1)
-            stats[key] = value.strip()
+        key, sep, value = line.partition("=")
+        if not sep or (keys is not None and key not in keys):
+            continue
+        stats[key] = value.strip()
+        if keys is not None and len(stats) == len(keys):
+            break
     return stats
 
 
+@lru_cache(maxsize=1)
+def _control_ssl_context() -> ssl.SSLContext:
+    """Get a cached TLS context for Unbound's remote-control port."""
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    # Certificates are self-signed with a fixed CN, so pin the server cert instead
+    context.check_hostname = False
+    context.load_verify_locations(str(CONTROL_SERVER_CERT))
+    context.load_cert_chain(str(CONTROL_CERT), str(CONTROL_KEY))
+    return context
+
+
+def unbound_control(command: str, timeout: float = 5.0) -> Optional[str]:
+    """
+    Send a command directly to Unbound's remote-control port.
+    
+    Args:
+        command: Control command, e.g. "stats_noreset"
+        timeout: Socket timeout in seconds
+    
+    Returns:
+        The command output, or None if the control port could not be used
+    """
+    try:
+        context = _control_ssl_context()
+        with socket.create_connection((CONTROL_HOST, CONTROL_PORT), timeout=timeout) as sock:
+            with context.wrap_socket(sock) as tls:
+                tls.sendall(f"UBCT1 {command}\n".encode())
+                chunks = []
+                while True:
+                    try:
+                        data = tls.recv(65536)
+                    except ssl.SSLEOFError:
+                        break
+                    if not data:
+                        break
+                    chunks.append(data)
+    except (OSError, ssl.SSLError):
+        return None
+    
+    output = b"".join(chunks).decode(errors="replace")
+    if output.startswith("error"):
+        return None
+    return output
+
+
+def get_unbound_stats(keys: Optional[Tuple[str, ...]] = None) -> Optional[Dict[str, str]]:
+    """Get Unbound statistics without resetting the counters.
+    
+    Args:
+        keys: If given, only these stats are parsed (see parse_unbound_stats)
+    """
+    raw = unbound_control("stats_noreset")
+    if raw is None:
+        # Fall back to the unbound-control binary
+        try:
+            result = run_command(["unbound-control", "stats_noreset"], check=False)
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        raw = result.stdout
+    return parse_unbound_stats(raw, keys)
+
+
 def validate_ip_address(ip: str) -> bool:
     """Validate an IP address."""
     try:
@@ -262,12 +527,13 @@ def validate_ip_address(ip: str) -> bool:
 def check_package_installed(package: str) -> bool:
     """Check if a system package is installed."""
     try:
+        # Query the machine-readable status field instead of scanning dpkg -l output
         result = run_command(
-            ["dpkg", "-l", package],
+            ["dpkg-query", "-W", "-f=${Status}", package],
             check=False,
             capture_output=True,
         )
-        return result.returncode == 0 and "ii" in result.stdout
+        return result.returncode == 0 and result.stdout.strip() == "install ok installed"
     except Exception:
         return False
 